@@ -3,149 +3,376 @@
 from __future__ import annotations
 
 import asyncio
-import os
 import subprocess
+from collections import deque
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from android_emu_agent.debugger.manager import DebugManager, DebugSessionState
 from android_emu_agent.errors import AgentError
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from android_emu_agent.debugger.bridge_client import BridgeClient
+
+# Async tests here share one module-scoped loop. The mark also lands on the
+# module's sync tests, where it does nothing but make pytest-asyncio warn.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.filterwarnings(
+        "ignore:The test <Function .*> is marked with '@pytest.mark.asyncio':pytest.PytestWarning"
+    ),
+]
+
+_BASE_SESSION = DebugSessionState(
+    session_id="s-test",
+    package="com.example.app",
+    process_name="com.example.app",
+    pid=123,
+    jdwp_port=123,
+    local_forward_port=54321,
+    device_serial="emulator-5554",
+    state="attached",
+)
+
+# Canned bridge payloads shared read-only across tests.
+_ATTACH_RESPONSE: dict[str, Any] = {
+    "status": "attached",
+    "vm_name": "Dalvik",
+    "vm_version": "1.0",
+    "thread_count": 8,
+    "suspended": False,
+}
+_STEP_STOPPED: dict[str, Any] = {"status": "stopped"}
+_BREAKPOINT_HIT_EVENT: dict[str, Any] = {
+    "jsonrpc": "2.0",
+    "method": "event",
+    "params": {
+        "type": "breakpoint_hit",
+        "breakpoint_id": 3,
+        "thread": "main",
+        "location": "com.example.MainActivity:25",
+    },
+}
+_LOGPOINT_HIT_EVENT: dict[str, Any] = {
+    "jsonrpc": "2.0",
+    "method": "event",
+    "params": {
+        "type": "logpoint_hit",
+        "breakpoint_id": 9,
+        "message": "x=3",
+        "hit_count": 1,
+        "thread": "main",
+        "location": "com.example.MainActivity:55",
+    },
+}
+
+# `ps -A -o PID,NAME` outputs for the com.example.app PID resolution tests.
+_PS_EMPTY = "PID NAME\n"
+_PS_SINGLE = "PID NAME\n12345 com.example.app\n"
+_PS_REMOTE_THEN_MAIN = "PID NAME\n123 com.example.app:remote\n456 com.example.app\n"
+_PS_MAIN_THEN_REMOTE = "PID NAME\n123 com.example.app\n456 com.example.app:remote\n"
+_PS_SECONDARY_ONLY = "PID NAME\n123 com.example.app:alpha\n456 com.example.app:beta\n"
 
-def _make_open_transport_context(jdwp_output: str) -> MagicMock:
-    conn = MagicMock()
-    conn.read_string_block = MagicMock(return_value=jdwp_output)
-    ctx = MagicMock()
-    ctx.__enter__.return_value = conn
-    ctx.__exit__.return_value = None
-    return ctx
+_JDWP_TIMEOUT = subprocess.TimeoutExpired(
+    cmd=["adb", "-s", "emulator-5554", "jdwp"],
+    timeout=1.0,
+    output=b"1649\n5182\n6547\n",
+)
 
 
-class TestFindJava:
-    """Tests for JDK detection."""
+def _attach_session(manager: DebugManager, **changes: Any) -> None:
+    """Register a copy of ``_BASE_SESSION`` (with ``changes`` applied) on ``manager``."""
+    session = replace(_BASE_SESSION, **changes)
+    manager._debug_sessions[session.session_id] = session
 
-    def test_find_java_from_java_home(self, tmp_path: Path) -> None:
-        java_bin = tmp_path / "bin" / "java"
-        java_bin.parent.mkdir(parents=True)
-        java_bin.touch()
 
-        manager = DebugManager()
-        with patch.dict(os.environ, {"JAVA_HOME": str(tmp_path)}):
-            result = manager._find_java()
-        assert result == java_bin
+@pytest.fixture(scope="session")
+def fake_jdk(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only JAVA_HOME layout with an empty ``bin/java``."""
+    java_home = tmp_path_factory.mktemp("jdk")
+    (java_home / "bin").mkdir()
+    (java_home / "bin" / "java").touch()
+    return java_home
 
-    def test_find_java_from_path(self) -> None:
-        manager = DebugManager()
-        with (
-            patch.dict(os.environ, {}, clear=True),
-            patch("shutil.which", return_value="/usr/bin/java"),
-        ):
-            os.environ.pop("JAVA_HOME", None)
-            result = manager._find_java()
-        assert result == Path("/usr/bin/java")
 
-    def test_find_java_not_found(self) -> None:
-        manager = DebugManager()
-        with (
-            patch.dict(os.environ, {}, clear=True),
-            patch("shutil.which", return_value=None),
-        ):
-            os.environ.pop("JAVA_HOME", None)
-            with pytest.raises(AgentError) as exc_info:
-                manager._find_java()
-        assert exc_info.value.code == "ERR_JDK_NOT_FOUND"
+@pytest.fixture(scope="session")
+def fake_jar(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only bridge JAR file."""
+    jar = tmp_path_factory.mktemp("bridge") / "jdi-bridge-0.1.10-all.jar"
+    jar.touch()
+    return jar
+
+
+@pytest.fixture
+def patched_which(monkeypatch: pytest.MonkeyPatch) -> Callable[[str | None], None]:
+    """Return a setter that makes ``shutil.which`` resolve to a fixed path."""
 
+    def _set(path: str | None) -> None:
+        monkeypatch.setattr("shutil.which", lambda *_args, **_kwargs: path)
+
+    return _set
 
-class TestFindJar:
-    """Tests for JAR resolution."""
 
-    def test_find_jar_from_env_var(self, tmp_path: Path) -> None:
-        jar = tmp_path / "bridge.jar"
-        jar.touch()
+@pytest.fixture
+def manager() -> DebugManager:
+    return DebugManager()
+
 
-        manager = DebugManager()
-        with patch.dict(os.environ, {"ANDROID_EMU_AGENT_BRIDGE_JAR": str(jar)}):
-            result = manager._find_jar()
-        assert result == jar
+@pytest.fixture
+def attached_session(manager: DebugManager) -> None:
+    """Register the default ``s-test`` session on the per-test manager."""
+    _attach_session(manager)
 
-    def test_find_jar_env_var_missing_file(self) -> None:
-        manager = DebugManager()
-        with (
-            patch.dict(os.environ, {"ANDROID_EMU_AGENT_BRIDGE_JAR": "/nonexistent.jar"}),
-            pytest.raises(AgentError) as exc_info,
-        ):
+
+@pytest.fixture
+def adb_device() -> SimpleNamespace:
+    """Stand-in for an adbutils device; tests attach only the methods they exercise."""
+    return SimpleNamespace(serial="emulator-5554")
+
+
+def async_const(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Return a coroutine function that ignores its arguments and returns ``value``."""
+
+    async def _const(*_args: Any, **_kwargs: Any) -> Any:
+        return value
+
+    return _const
+
+
+class EventSource:
+    """Bridge stand-in whose ``next_event`` yields canned events, then cancels."""
+
+    __slots__ = ("_events",)
+
+    def __init__(self, *events: dict[str, Any]) -> None:
+        self._events = deque(events)
+
+    async def next_event(self) -> dict[str, Any]:
+        if not self._events:
+            raise asyncio.CancelledError
+        return self._events.popleft()
+
+
+class Recorder:
+    """Callable that records positional-argument calls and returns a fixed result."""
+
+    __slots__ = ("calls", "result")
+
+    def __init__(self, result: Any = None) -> None:
+        self.result = result
+        self.calls: list[tuple[Any, ...]] = []
+
+    def __call__(self, *args: Any) -> Any:
+        self.calls.append(args)
+        return self.result
+
+
+class FakeBridge:
+    """Bridge stand-in that records ``request`` calls and returns a canned response."""
+
+    is_alive = True
+
+    def __init__(self, response: dict[str, Any]) -> None:
+        self.response = response
+        self.calls: list[tuple[str, dict[str, Any] | None]] = []
+
+    async def request(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.calls.append((method, params))
+        return self.response
+
+    async def stop(self) -> None:
+        self.is_alive = False
+
+
+def _install_bridge(manager: DebugManager, response: dict[str, Any]) -> FakeBridge:
+    bridge = FakeBridge(response)
+    manager._bridges["s-test"] = cast("BridgeClient", bridge)
+    return bridge
+
+
+def _stub_attach_steps(
+    monkeypatch: pytest.MonkeyPatch, manager: DebugManager, bridge: FakeBridge
+) -> None:
+    """Short-circuit the PID, forwarding, bridge and monitor steps around ``attach``."""
+    stubs = {
+        "start_bridge": bridge,
+        "_find_pid": (12345, "com.example.app"),
+        "_setup_forward": 54321,
+        "_monitor_events": None,
+        "_remove_forward": None,
+        "stop_bridge": None,
+    }
+    for name, value in stubs.items():
+        monkeypatch.setattr(manager, name, async_const(value))
+
+
+class _FakeTransport:
+    """Stand-in for the ``open_transport("jdwp")`` context and its connection."""
+
+    __slots__ = ("_output",)
+
+    def __init__(self, output: str) -> None:
+        self._output = output
+
+    def __enter__(self) -> _FakeTransport:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def read_string_block(self) -> str:
+        return self._output
+
+
+def test_find_java_from_java_home(
+    fake_jdk: Path, manager: DebugManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("JAVA_HOME", str(fake_jdk))
+    assert manager._find_java() == fake_jdk / "bin" / "java"
+
+
+def test_find_java_from_path(
+    manager: DebugManager,
+    patched_which: Callable[[str | None], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("JAVA_HOME", raising=False)
+    patched_which("/usr/bin/java")
+    assert manager._find_java() == Path("/usr/bin/java")
+
+
+def test_find_java_not_found(
+    manager: DebugManager,
+    patched_which: Callable[[str | None], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("JAVA_HOME", raising=False)
+    patched_which(None)
+    with pytest.raises(AgentError) as exc_info:
+        manager._find_java()
+    assert exc_info.value.code == "ERR_JDK_NOT_FOUND"
+
+
+def test_find_java_memoized(
+    manager: DebugManager,
+    patched_which: Callable[[str | None], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A resolved java path is reused without consulting JAVA_HOME or PATH again."""
+    monkeypatch.delenv("JAVA_HOME", raising=False)
+    patched_which("/usr/bin/java")
+    first = manager._find_java()
+
+    patched_which(None)
+    assert manager._find_java() is first
+    assert manager._java_path is first
+
+
+@pytest.mark.parametrize(
+    ("env_value", "expected_code"),
+    [
+        pytest.param("<fake_jar>", None, id="env-var"),
+        pytest.param("/nonexistent.jar", "ERR_BRIDGE_NOT_RUNNING", id="env-var-missing-file"),
+    ],
+)
+def test_find_jar_from_env_var(
+    fake_jar: Path,
+    manager: DebugManager,
+    env_value: str,
+    expected_code: str | None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The env var wins when set, and must name an existing file.
+
+    ``"<fake_jar>"`` stands for the session fake JAR's path.
+    """
+    if env_value == "<fake_jar>":
+        env_value = str(fake_jar)
+    monkeypatch.setenv("ANDROID_EMU_AGENT_BRIDGE_JAR", env_value)
+    resolve = MagicMock()
+    monkeypatch.setattr(manager._downloader, "resolve", resolve)
+
+    if expected_code is None:
+        assert manager._find_jar() == fake_jar
+    else:
+        with pytest.raises(AgentError) as exc_info:
             manager._find_jar()
-        assert exc_info.value.code == "ERR_BRIDGE_NOT_RUNNING"
+        assert exc_info.value.code == expected_code
+    resolve.assert_not_called()
 
-    def test_find_jar_uses_downloader(self, tmp_path: Path) -> None:
-        downloaded = tmp_path / "jdi-bridge-0.1.10-all.jar"
-        downloaded.touch()
 
-        manager = DebugManager()
-        with (
-            patch.dict(os.environ, {}, clear=True),
-            patch("pathlib.Path.cwd", return_value=tmp_path / "empty"),
-            patch(
-                "android_emu_agent.debugger.manager._DEV_JAR_RELATIVE", Path("missing/build/libs")
-            ),
-            patch.object(manager._downloader, "resolve", return_value=downloaded) as resolve,
-        ):
-            result = manager._find_jar()
-        resolve.assert_called_once()
-        assert result == downloaded
+def test_find_jar_uses_downloader(
+    fake_jar: Path, manager: DebugManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("ANDROID_EMU_AGENT_BRIDGE_JAR", raising=False)
+    monkeypatch.setattr(Path, "cwd", staticmethod(lambda: fake_jar.parent / "empty"))
+    monkeypatch.setattr(
+        "android_emu_agent.debugger.manager._DEV_JAR_RELATIVE", Path("missing/build/libs")
+    )
+    resolve = MagicMock(return_value=fake_jar)
+    monkeypatch.setattr(manager._downloader, "resolve", resolve)
+
+    assert manager._find_jar() == fake_jar
+    resolve.assert_called_once()
+
+
+def test_find_jar_memoized(
+    fake_jar: Path, manager: DebugManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A resolved JAR path is reused without touching the filesystem or downloader."""
+    monkeypatch.setenv("ANDROID_EMU_AGENT_BRIDGE_JAR", str(fake_jar))
+    first = manager._find_jar()
+
+    monkeypatch.delenv("ANDROID_EMU_AGENT_BRIDGE_JAR")
+    is_file, is_dir, resolve = MagicMock(), MagicMock(), MagicMock()
+    monkeypatch.setattr(Path, "is_file", is_file)
+    monkeypatch.setattr(Path, "is_dir", is_dir)
+    monkeypatch.setattr(manager._downloader, "resolve", resolve)
+
+    assert manager._find_jar() is first
+    assert manager._jar_path is first
+    is_file.assert_not_called()
+    is_dir.assert_not_called()
+    resolve.assert_not_called()
 
 
 class TestDebugManagerLifecycle:
     """Tests for bridge lifecycle management."""
 
-    @pytest.mark.asyncio
-    async def test_get_bridge_not_attached(self) -> None:
-        manager = DebugManager()
+    async def test_get_bridge_not_attached(self, manager: DebugManager) -> None:
         with pytest.raises(AgentError) as exc_info:
             await manager.get_bridge("s-nonexistent")
         assert exc_info.value.code == "ERR_DEBUG_NOT_ATTACHED"
 
-    @pytest.mark.asyncio
-    async def test_stop_all_empty(self) -> None:
-        manager = DebugManager()
+    async def test_stop_all_empty(self, manager: DebugManager) -> None:
         await manager.stop_all()
 
 
 class TestAttach:
     """Tests for debug attach flow."""
 
-    @pytest.mark.asyncio
-    async def test_attach_stores_session_state(self) -> None:
-        manager = DebugManager()
-
-        mock_adb = MagicMock()
-        mock_bridge = AsyncMock()
-        mock_bridge.is_alive = True
-        mock_bridge.request = AsyncMock(
-            return_value={
-                "status": "attached",
-                "vm_name": "Dalvik",
-                "vm_version": "1.0",
-                "thread_count": 8,
-                "suspended": False,
-            }
-        )
-        mock_bridge.next_event = AsyncMock()
+    async def test_attach_stores_session_state(
+        self,
+        manager: DebugManager,
+        adb_device: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        bridge = FakeBridge(_ATTACH_RESPONSE)
+        _stub_attach_steps(monkeypatch, manager, bridge)
 
-        with (
-            patch.object(manager, "_find_pid", AsyncMock(return_value=(12345, "com.example.app"))),
-            patch.object(manager, "_setup_forward", AsyncMock(return_value=54321)),
-            patch.object(manager, "start_bridge", AsyncMock(return_value=mock_bridge)),
-            patch.object(manager, "_monitor_events", AsyncMock()),
-        ):
-            result = await manager.attach(
-                session_id="s-test",
-                device_serial="emulator-5554",
-                package="com.example.app",
-                adb_device=mock_adb,
-            )
+        result = await manager.attach(
+            session_id="s-test",
+            device_serial="emulator-5554",
+            package="com.example.app",
+            adb_device=adb_device,
+        )
 
         assert result["status"] == "attached"
         assert result["pid"] == 12345
@@ -154,106 +381,69 @@ class TestAttach:
         assert result["threads"] == 8
         assert result["process_name"] == "com.example.app"
         assert result["keep_suspended"] is False
-        assert "s-test" in manager._debug_sessions
-        ds = manager._debug_sessions["s-test"]
+        ds = manager._debug_sessions.get("s-test")
+        assert ds is not None
         assert ds.package == "com.example.app"
         assert ds.process_name == "com.example.app"
         assert ds.pid == 12345
         assert ds.state == "attached"
         assert manager._event_queues["s-test"] == []
-        mock_bridge.request.assert_awaited_once_with(
-            "attach",
-            {"host": "localhost", "port": 54321, "keep_suspended": False},
-        )
+        assert bridge.calls == [
+            ("attach", {"host": "localhost", "port": 54321, "keep_suspended": False})
+        ]
 
-    @pytest.mark.asyncio
-    async def test_attach_forwards_keep_suspended(self) -> None:
-        manager = DebugManager()
-
-        mock_adb = MagicMock()
-        mock_bridge = AsyncMock()
-        mock_bridge.is_alive = True
-        mock_bridge.request = AsyncMock(
-            return_value={
-                "status": "attached",
-                "vm_name": "Dalvik",
-                "vm_version": "1.0",
-                "thread_count": 8,
-                "suspended": True,
-            }
-        )
-        mock_bridge.next_event = AsyncMock()
+    async def test_attach_forwards_keep_suspended(
+        self,
+        manager: DebugManager,
+        adb_device: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        bridge = FakeBridge({**_ATTACH_RESPONSE, "suspended": True})
+        _stub_attach_steps(monkeypatch, manager, bridge)
 
-        with (
-            patch.object(manager, "_find_pid", AsyncMock(return_value=(12345, "com.example.app"))),
-            patch.object(manager, "_setup_forward", AsyncMock(return_value=54321)),
-            patch.object(manager, "start_bridge", AsyncMock(return_value=mock_bridge)),
-            patch.object(manager, "_monitor_events", AsyncMock()),
-        ):
-            result = await manager.attach(
-                session_id="s-test",
-                device_serial="emulator-5554",
-                package="com.example.app",
-                adb_device=mock_adb,
-                keep_suspended=True,
-            )
+        result = await manager.attach(
+            session_id="s-test",
+            device_serial="emulator-5554",
+            package="com.example.app",
+            adb_device=adb_device,
+            keep_suspended=True,
+        )
 
         assert result["suspended"] is True
         assert result["keep_suspended"] is True
-        mock_bridge.request.assert_awaited_once_with(
-            "attach",
-            {"host": "localhost", "port": 54321, "keep_suspended": True},
-        )
+        assert bridge.calls == [
+            ("attach", {"host": "localhost", "port": 54321, "keep_suspended": True})
+        ]
 
-    @pytest.mark.asyncio
-    async def test_attach_already_attached_raises(self) -> None:
-        manager = DebugManager()
-        manager._debug_sessions["s-test"] = DebugSessionState(
-            session_id="s-test",
-            package="com.example.app",
-            process_name="com.example.app",
-            pid=123,
-            jdwp_port=123,
-            local_forward_port=54321,
-            device_serial="emulator-5554",
-            state="attached",
-        )
+    async def test_attach_already_attached_raises(
+        self, manager: DebugManager, adb_device: SimpleNamespace
+    ) -> None:
+        _attach_session(manager)
 
-        mock_adb = MagicMock()
         with pytest.raises(AgentError) as exc_info:
             await manager.attach(
                 session_id="s-test",
                 device_serial="emulator-5554",
                 package="com.example.app",
-                adb_device=mock_adb,
+                adb_device=adb_device,
             )
         assert exc_info.value.code == "ERR_ALREADY_ATTACHED"
 
-    @pytest.mark.asyncio
-    async def test_attach_maps_not_debuggable_error(self) -> None:
-        manager = DebugManager()
+    async def test_attach_maps_not_debuggable_error(
+        self,
+        manager: DebugManager,
+        adb_device: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        bridge = FakeBridge({"error": {"message": "JDWP handshake failed: connection closed"}})
+        _stub_attach_steps(monkeypatch, manager, bridge)
 
-        mock_adb = MagicMock()
-        mock_bridge = AsyncMock()
-        mock_bridge.is_alive = True
-        mock_bridge.request = AsyncMock(
-            return_value={"error": {"message": "JDWP handshake failed: connection closed"}}
-        )
-        mock_bridge.next_event = AsyncMock()
-
-        with (
-            patch.object(manager, "_find_pid", AsyncMock(return_value=(12345, "com.example.app"))),
-            patch.object(manager, "_setup_forward", AsyncMock(return_value=54321)),
-            patch.object(manager, "start_bridge", AsyncMock(return_value=mock_bridge)),
-            patch.object(manager, "_remove_forward", AsyncMock()),
-            patch.object(manager, "stop_bridge", AsyncMock()),
-            pytest.raises(AgentError) as exc_info,
-        ):
+        with pytest.raises(AgentError) as exc_info:
             await manager.attach(
                 session_id="s-test",
                 device_serial="emulator-5554",
                 package="com.example.app",
-                adb_device=mock_adb,
+                adb_device=adb_device,
             )
         assert exc_info.value.code == "ERR_APP_NOT_DEBUGGABLE"
 
@@ -261,194 +451,141 @@ class TestAttach:
 class TestDetach:
     """Tests for debug detach flow."""
 
-    @pytest.mark.asyncio
-    async def test_detach_cleans_up(self) -> None:
-        manager = DebugManager()
-        manager._debug_sessions["s-test"] = DebugSessionState(
-            session_id="s-test",
-            package="com.example.app",
-            process_name="com.example.app",
-            pid=123,
-            jdwp_port=123,
-            local_forward_port=54321,
-            device_serial="emulator-5554",
-            state="attached",
-        )
+    async def test_detach_cleans_up(
+        self, manager: DebugManager, adb_device: SimpleNamespace
+    ) -> None:
+        _attach_session(manager)
 
-        mock_bridge = AsyncMock()
-        mock_bridge.is_alive = True
-        mock_bridge.request = AsyncMock(return_value={"status": "detached"})
-        manager._bridges["s-test"] = mock_bridge
+        _install_bridge(manager, {"status": "detached"})
 
-        mock_adb = MagicMock()
-        mock_adb.forward_remove = MagicMock()
+        adb_device.forward_remove = Recorder()
 
-        result = await manager.detach("s-test", mock_adb)
+        result = await manager.detach("s-test", adb_device)
         assert result["status"] == "detached"
         assert "s-test" not in manager._debug_sessions
         assert "s-test" not in manager._bridges
         assert "s-test" not in manager._event_queues
-        mock_adb.forward_remove.assert_called_once_with("tcp:54321", False)
+        assert adb_device.forward_remove.calls == [("tcp:54321", False)]
 
-    @pytest.mark.asyncio
-    async def test_detach_when_not_attached_raises(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
+    async def test_detach_when_not_attached_raises(
+        self, manager: DebugManager, adb_device: SimpleNamespace
+    ) -> None:
         with pytest.raises(AgentError) as exc_info:
-            await manager.detach("s-nonexistent", mock_adb)
+            await manager.detach("s-nonexistent", adb_device)
         assert exc_info.value.code == "ERR_DEBUG_NOT_ATTACHED"
 
 
 class TestStatus:
     """Tests for debug status."""
 
-    @pytest.mark.asyncio
-    async def test_status_not_attached(self) -> None:
-        manager = DebugManager()
-        result = await manager.status("s-nonexistent")
-        assert result["status"] == "not_attached"
-
-    @pytest.mark.asyncio
-    async def test_status_attached(self) -> None:
-        manager = DebugManager()
-        manager._debug_sessions["s-test"] = DebugSessionState(
-            session_id="s-test",
-            package="com.example.app",
-            process_name="com.example.app",
-            pid=123,
-            jdwp_port=123,
-            local_forward_port=54321,
-            device_serial="emulator-5554",
-            state="attached",
-            vm_name="Dalvik",
-            vm_version="1.0",
-        )
-
-        mock_bridge = AsyncMock()
-        mock_bridge.is_alive = True
-        mock_bridge.request = AsyncMock(
-            return_value={
-                "status": "attached",
-                "vm_name": "Dalvik",
-                "vm_version": "1.0",
-                "thread_count": 5,
-                "suspended": False,
-            }
-        )
-        manager._bridges["s-test"] = mock_bridge
+    @pytest.mark.parametrize(
+        ("session", "response", "expected"),
+        [
+            pytest.param(None, None, {"status": "not_attached"}, id="not-attached"),
+            pytest.param(
+                {"vm_name": "Dalvik", "vm_version": "1.0"},
+                _ATTACH_RESPONSE,
+                {
+                    "status": "attached",
+                    "package": "com.example.app",
+                    "process_name": "com.example.app",
+                    "pid": 123,
+                    "thread_count": 8,
+                    "suspended": False,
+                },
+                id="attached",
+            ),
+            pytest.param(
+                {
+                    "state": "disconnected",
+                    "disconnect_reason": "app_crashed",
+                    "disconnect_detail": "VM disconnected",
+                },
+                None,
+                {
+                    "status": "disconnected",
+                    "reason": "app_crashed",
+                    "remediation": "The app crashed. Relaunch it and attach again.",
+                },
+                id="disconnected-includes-remediation",
+            ),
+        ],
+    )
+    async def test_status(
+        self,
+        manager: DebugManager,
+        session: dict[str, Any] | None,
+        response: dict[str, Any] | None,
+        expected: dict[str, Any],
+    ) -> None:
+        if session is not None:
+            _attach_session(manager, **session)
+        if response is not None:
+            _install_bridge(manager, response)
 
         result = await manager.status("s-test")
-        assert result["status"] == "attached"
-        assert result["package"] == "com.example.app"
-        assert result["process_name"] == "com.example.app"
-        assert result["pid"] == 123
-        assert result["thread_count"] == 5
-        assert result["suspended"] is False
-
-    @pytest.mark.asyncio
-    async def test_status_disconnected_includes_remediation(self) -> None:
-        manager = DebugManager()
-        manager._debug_sessions["s-test"] = DebugSessionState(
-            session_id="s-test",
-            package="com.example.app",
-            process_name="com.example.app",
-            pid=123,
-            jdwp_port=123,
-            local_forward_port=54321,
-            device_serial="emulator-5554",
-            state="disconnected",
-            disconnect_reason="app_crashed",
-            disconnect_detail="VM disconnected",
-        )
-        result = await manager.status("s-test")
-        assert result["status"] == "disconnected"
-        assert "Relaunch" in result["remediation"]
+        assert {key: result[key] for key in expected} == expected
 
 
 class TestPidResolution:
     """Tests for package PID/JDWP mapping."""
 
-    @pytest.mark.asyncio
-    async def test_find_pid_single_match(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.open_transport = MagicMock(return_value=_make_open_transport_context("12345\n"))
-        mock_adb.shell = MagicMock(return_value="PID NAME\n12345 com.example.app\n")
-
-        pid, process_name = await manager._find_pid("com.example.app", mock_adb)
-        assert pid == 12345
-        assert process_name == "com.example.app"
-
-    @pytest.mark.asyncio
-    async def test_find_pid_prefers_main_process(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.open_transport = MagicMock(return_value=_make_open_transport_context("123 456\n"))
-        mock_adb.shell = MagicMock(
-            return_value=("PID NAME\n123 com.example.app:remote\n456 com.example.app\n")
-        )
-
-        pid, process_name = await manager._find_pid("com.example.app", mock_adb)
-        assert pid == 456
-        assert process_name == "com.example.app"
-
-    @pytest.mark.asyncio
-    async def test_find_pid_multiple_without_main_requires_process(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.open_transport = MagicMock(return_value=_make_open_transport_context("123 456\n"))
-        mock_adb.shell = MagicMock(
-            return_value=("PID NAME\n123 com.example.app:alpha\n456 com.example.app:beta\n")
-        )
-
-        with pytest.raises(AgentError) as exc_info:
-            await manager._find_pid("com.example.app", mock_adb)
-        assert exc_info.value.code == "ERR_MULTIPLE_DEBUGGABLE_PROCESSES"
-
-    @pytest.mark.asyncio
-    async def test_find_pid_explicit_process(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.open_transport = MagicMock(return_value=_make_open_transport_context("123 456\n"))
-        mock_adb.shell = MagicMock(
-            return_value=("PID NAME\n123 com.example.app\n456 com.example.app:remote\n")
-        )
-
-        pid, process_name = await manager._find_pid(
-            "com.example.app",
-            mock_adb,
-            process_name="com.example.app:remote",
-        )
-        assert pid == 456
-        assert process_name == "com.example.app:remote"
-
-    @pytest.mark.asyncio
-    async def test_find_pid_not_debuggable(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.open_transport = MagicMock(return_value=_make_open_transport_context(""))
-        mock_adb.shell = MagicMock(return_value="PID NAME\n12345 com.example.app\n")
-
-        with pytest.raises(AgentError) as exc_info:
-            await manager._find_pid("com.example.app", mock_adb)
-        assert exc_info.value.code == "ERR_APP_NOT_DEBUGGABLE"
-
-    @pytest.mark.asyncio
-    async def test_find_pid_not_found(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.open_transport = MagicMock(return_value=_make_open_transport_context(""))
-        mock_adb.shell = MagicMock(return_value="PID NAME\n")
-
-        with pytest.raises(AgentError) as exc_info:
-            await manager._find_pid("com.example.app", mock_adb)
-        assert exc_info.value.code == "ERR_PROCESS_NOT_FOUND"
+    @pytest.mark.parametrize(
+        ("jdwp_output", "ps_output", "process_name", "expected"),
+        [
+            pytest.param(
+                "12345\n", _PS_SINGLE, None, (12345, "com.example.app"), id="single-match"
+            ),
+            pytest.param(
+                "123 456\n",
+                _PS_REMOTE_THEN_MAIN,
+                None,
+                (456, "com.example.app"),
+                id="prefers-main-process",
+            ),
+            pytest.param(
+                "123 456\n",
+                _PS_SECONDARY_ONLY,
+                None,
+                "ERR_MULTIPLE_DEBUGGABLE_PROCESSES",
+                id="multiple-without-main",
+            ),
+            pytest.param(
+                "123 456\n",
+                _PS_MAIN_THEN_REMOTE,
+                "com.example.app:remote",
+                (456, "com.example.app:remote"),
+                id="explicit-process",
+            ),
+            pytest.param("", _PS_SINGLE, None, "ERR_APP_NOT_DEBUGGABLE", id="not-debuggable"),
+            pytest.param("", _PS_EMPTY, None, "ERR_PROCESS_NOT_FOUND", id="not-found"),
+        ],
+    )
+    async def test_find_pid(
+        self,
+        manager: DebugManager,
+        adb_device: SimpleNamespace,
+        jdwp_output: str,
+        ps_output: str,
+        process_name: str | None,
+        expected: tuple[int, str] | str,
+    ) -> None:
+        """Expected is the resolved (pid, process name), or the AgentError code raised."""
+        adb_device.open_transport = Recorder(_FakeTransport(jdwp_output))
+        adb_device.shell = Recorder(ps_output)
+
+        find = manager._find_pid("com.example.app", adb_device, process_name=process_name)
+        if isinstance(expected, str):
+            with pytest.raises(AgentError) as exc_info:
+                await find
+            assert exc_info.value.code == expected
+        else:
+            assert await find == expected
 
-    @pytest.mark.asyncio
-    async def test_list_jdwp_pids_falls_back_to_adb_cli(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.serial = "emulator-5554"
+    async def test_list_jdwp_pids_falls_back_to_adb_cli(
+        self, manager: DebugManager, adb_device: SimpleNamespace
+    ) -> None:
+        adb_device.serial = "emulator-5554"
 
         with (
             patch.object(
@@ -462,22 +599,15 @@ class TestPidResolution:
                 return_value="1649\n5182\n6547\n",
             ),
         ):
-            pids = await manager._list_jdwp_pids(mock_adb)
+            pids = await manager._list_jdwp_pids(adb_device)
 
         assert pids == {1649, 5182, 6547}
 
-    def test_read_jdwp_list_via_adb_parses_timeout_partial_output(self) -> None:
-        manager = DebugManager()
-        timeout = subprocess.TimeoutExpired(
-            cmd=["adb", "-s", "emulator-5554", "jdwp"],
-            timeout=1.0,
-            output=b"1649\n5182\n6547\n",
-        )
-
-        with (
-            patch("shutil.which", return_value="/usr/bin/adb"),
-            patch("subprocess.run", side_effect=timeout),
-        ):
+    def test_read_jdwp_list_via_adb_parses_timeout_partial_output(
+        self, manager: DebugManager, patched_which: Callable[[str | None], None]
+    ) -> None:
+        patched_which("/usr/bin/adb")
+        with patch("subprocess.run", side_effect=_JDWP_TIMEOUT):
             output = manager._read_jdwp_list_via_adb("emulator-5554")
 
         assert output.strip().splitlines() == ["1649", "5182", "6547"]
@@ -486,451 +616,276 @@ class TestPidResolution:
 class TestForwarding:
     """Tests for ADB forwarding lifecycle."""
 
-    @pytest.mark.asyncio
-    async def test_setup_forward_uses_forward_port(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.forward_port = MagicMock(return_value=54321)
+    async def test_setup_forward_uses_forward_port(
+        self, manager: DebugManager, adb_device: SimpleNamespace
+    ) -> None:
+        adb_device.forward_port = Recorder(54321)
 
-        port = await manager._setup_forward(12345, mock_adb)
+        port = await manager._setup_forward(12345, adb_device)
         assert port == 54321
-        mock_adb.forward_port.assert_called_once_with("jdwp:12345")
+        assert adb_device.forward_port.calls == [("jdwp:12345",)]
 
-    @pytest.mark.asyncio
-    async def test_remove_forward_uses_forward_remove(self) -> None:
-        manager = DebugManager()
-        mock_adb = MagicMock()
-        mock_adb.forward_remove = MagicMock()
+    async def test_remove_forward_uses_forward_remove(
+        self, manager: DebugManager, adb_device: SimpleNamespace
+    ) -> None:
+        adb_device.forward_remove = Recorder()
 
-        await manager._remove_forward(54321, mock_adb)
-        mock_adb.forward_remove.assert_called_once_with("tcp:54321", False)
+        await manager._remove_forward(54321, adb_device)
+        assert adb_device.forward_remove.calls == [("tcp:54321", False)]
 
 
 class TestDisconnectEvents:
     """Tests for async bridge events."""
 
-    @pytest.mark.asyncio
-    async def test_monitor_event_handles_event_notification_shape(self) -> None:
-        manager = DebugManager()
-        manager._debug_sessions["s-test"] = DebugSessionState(
-            session_id="s-test",
-            package="com.example.app",
-            process_name="com.example.app",
-            pid=12345,
-            jdwp_port=12345,
-            local_forward_port=54321,
-            device_serial="emulator-5554",
-            state="attached",
-        )
+    async def test_monitor_event_handles_event_notification_shape(
+        self,
+        manager: DebugManager,
+        adb_device: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _attach_session(manager, pid=12345, jdwp_port=12345)
 
-        bridge = MagicMock()
-        bridge.next_event = AsyncMock(
-            return_value={
+        bridge = EventSource(
+            {
                 "jsonrpc": "2.0",
                 "method": "event",
                 "params": {"type": "vm_disconnected", "reason": "device_disconnected"},
             }
         )
+        stopped: list[str] = []
+
+        async def stop_bridge(session_id: str) -> None:
+            stopped.append(session_id)
 
-        mock_adb = MagicMock()
-        with patch.object(manager, "stop_bridge", AsyncMock()) as stop_bridge:
-            await manager._monitor_events("s-test", bridge, mock_adb)
+        monkeypatch.setattr(manager, "stop_bridge", stop_bridge)
+
+        await manager._monitor_events("s-test", cast("BridgeClient", bridge), adb_device)
 
         ds = manager._debug_sessions["s-test"]
         assert ds.state == "disconnected"
         assert ds.disconnect_reason == "device_disconnected"
-        stop_bridge.assert_awaited_once_with("s-test")
+        assert stopped == ["s-test"]
 
 
+@pytest.mark.usefixtures("attached_session")
 class TestMilestone2DebugMethods:
     """Tests for breakpoint/thread/event manager APIs."""
 
-    @staticmethod
-    def _attach_session(manager: DebugManager, session_id: str = "s-test") -> None:
-        manager._debug_sessions[session_id] = DebugSessionState(
-            session_id=session_id,
-            package="com.example.app",
-            process_name="com.example.app",
-            pid=123,
-            jdwp_port=123,
-            local_forward_port=54321,
-            device_serial="emulator-5554",
-            state="attached",
-        )
-
-    @pytest.mark.asyncio
-    async def test_set_breakpoint_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "set", "breakpoint_id": 1})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.set_breakpoint("s-test", "com.example.MainActivity", 25)
-        assert result["status"] == "set"
-        bridge.request.assert_awaited_once_with(
-            "set_breakpoint",
-            {"class_pattern": "com.example.MainActivity", "line": 25},
-        )
-
-    @pytest.mark.asyncio
-    async def test_set_breakpoint_with_condition_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={
-                "status": "set",
-                "breakpoint_id": 2,
-                "condition": "counter > 5",
-            }
-        )
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.set_breakpoint(
-            "s-test",
-            "com.example.MainActivity",
-            30,
-            condition="counter > 5",
-        )
-        assert result["status"] == "set"
-        assert result["condition"] == "counter > 5"
-        bridge.request.assert_awaited_once_with(
-            "set_breakpoint",
-            {"class_pattern": "com.example.MainActivity", "line": 30, "condition": "counter > 5"},
-        )
-
-    @pytest.mark.asyncio
-    async def test_set_breakpoint_with_log_message_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={
-                "status": "set",
-                "breakpoint_id": 3,
-                "log_message": "hit {hitCount} times, val={myVar}",
-            }
-        )
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.set_breakpoint(
-            "s-test",
-            "com.example.MainActivity",
-            35,
-            log_message="hit {hitCount} times, val={myVar}",
-        )
-        assert result["status"] == "set"
-        assert result["log_message"] == "hit {hitCount} times, val={myVar}"
-        bridge.request.assert_awaited_once_with(
-            "set_breakpoint",
-            {
-                "class_pattern": "com.example.MainActivity",
-                "line": 35,
-                "log_message": "hit {hitCount} times, val={myVar}",
-            },
-        )
-
-    @pytest.mark.asyncio
-    async def test_set_breakpoint_with_condition_and_log_message_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={
-                "status": "set",
-                "breakpoint_id": 4,
-                "condition": "x > 0",
-                "log_message": "x={x}",
-            }
-        )
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.set_breakpoint(
-            "s-test",
-            "com.example.MainActivity",
-            40,
-            condition="x > 0",
-            log_message="x={x}",
-        )
-        assert result["status"] == "set"
-        bridge.request.assert_awaited_once_with(
-            "set_breakpoint",
-            {
-                "class_pattern": "com.example.MainActivity",
-                "line": 40,
-                "condition": "x > 0",
-                "log_message": "x={x}",
-            },
-        )
-
-    @pytest.mark.asyncio
-    async def test_set_breakpoint_with_logpoint_stack_capture_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={
-                "status": "set",
-                "breakpoint_id": 5,
-                "log_message": "x={x}",
-                "capture_stack": True,
-                "stack_max_frames": 12,
-            }
-        )
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.set_breakpoint(
-            "s-test",
-            "com.example.MainActivity",
-            41,
-            log_message="x={x}",
-            capture_stack=True,
-            stack_max_frames=12,
-        )
-        assert result["status"] == "set"
-        bridge.request.assert_awaited_once_with(
-            "set_breakpoint",
-            {
-                "class_pattern": "com.example.MainActivity",
-                "line": 41,
-                "log_message": "x={x}",
-                "capture_stack": True,
-                "stack_max_frames": 12,
-            },
-        )
-
-    @pytest.mark.asyncio
-    async def test_list_threads_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={"threads": [], "total_threads": 0, "truncated": False}
-        )
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.list_threads("s-test", include_daemon=True, max_threads=100)
-        assert result["status"] == "attached"
-        bridge.request.assert_awaited_once_with(
-            "list_threads",
-            {"include_daemon": True, "max_threads": 100},
-        )
-
-    @pytest.mark.asyncio
-    async def test_stack_trace_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"thread": "main", "frames": []})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.stack_trace("s-test", thread_name="main", max_frames=10)
-        assert result["thread"] == "main"
-        bridge.request.assert_awaited_once_with(
-            "stack_trace",
-            {"thread_name": "main", "max_frames": 10},
-        )
-
-    @pytest.mark.asyncio
-    async def test_inspect_variable_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={"variable_path": "user", "value": {"class": "User"}}
-        )
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.inspect_variable(
-            "s-test",
-            variable_path="user.profile",
-            thread_name="main",
-            frame_index=0,
-            depth=2,
-        )
-        assert result["variable_path"] == "user"
-        bridge.request.assert_awaited_once_with(
-            "inspect_variable",
-            {
-                "thread_name": "main",
-                "frame_index": 0,
-                "variable_path": "user.profile",
-                "depth": 2,
-            },
-        )
-
-    @pytest.mark.asyncio
-    async def test_evaluate_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"expression": "user.id", "result": 42})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.evaluate(
-            "s-test",
-            expression="user.id",
-            thread_name="main",
-            frame_index=0,
-        )
-        assert result["expression"] == "user.id"
-        bridge.request.assert_awaited_once_with(
-            "evaluate",
-            {
-                "thread_name": "main",
-                "frame_index": 0,
-                "expression": "user.id",
-            },
-        )
-
-    @pytest.mark.asyncio
-    async def test_load_mapping_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "loaded", "path": "/tmp/mapping.txt"})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.load_mapping("s-test", path="/tmp/mapping.txt")
-        assert result["status"] == "loaded"
-        bridge.request.assert_awaited_once_with("load_mapping", {"path": "/tmp/mapping.txt"})
-
-    @pytest.mark.asyncio
-    async def test_clear_mapping_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "cleared"})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.clear_mapping("s-test")
-        assert result["status"] == "cleared"
-        bridge.request.assert_awaited_once_with("clear_mapping")
-
-    @pytest.mark.asyncio
-    async def test_step_over_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "stopped"})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.step_over("s-test", thread_name="main", timeout_seconds=10.0)
-        assert result["status"] == "stopped"
-        bridge.request.assert_awaited_once_with(
-            "step_over",
-            {"thread_name": "main", "timeout_seconds": 10.0},
-        )
-
-    @pytest.mark.asyncio
-    async def test_step_into_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "stopped"})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.step_into("s-test", thread_name="main", timeout_seconds=10.0)
-        assert result["status"] == "stopped"
-        bridge.request.assert_awaited_once_with(
-            "step_into",
-            {"thread_name": "main", "timeout_seconds": 10.0},
-        )
-
-    @pytest.mark.asyncio
-    async def test_step_out_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "stopped"})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.step_out("s-test", thread_name="main", timeout_seconds=10.0)
-        assert result["status"] == "stopped"
-        bridge.request.assert_awaited_once_with(
-            "step_out",
-            {"thread_name": "main", "timeout_seconds": 10.0},
-        )
-
-    @pytest.mark.asyncio
-    async def test_resume_forwards_rpc_for_all_threads(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "resumed", "scope": "all"})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.resume("s-test", thread_name=None)
-        assert result["scope"] == "all"
-        bridge.request.assert_awaited_once_with("resume", {})
-
-    @pytest.mark.asyncio
-    async def test_resume_forwards_rpc_for_specific_thread(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "resumed", "scope": "thread"})
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.resume("s-test", thread_name="main")
-        assert result["scope"] == "thread"
-        bridge.request.assert_awaited_once_with("resume", {"thread_name": "main"})
-
-    @pytest.mark.asyncio
-    async def test_drain_events_returns_and_clears_queue(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-        manager._event_queues["s-test"] = [
+    @pytest.mark.parametrize(
+        ("api", "kwargs", "expected_params", "response", "envelope"),
+        [
+            pytest.param(
+                "set_breakpoint",
+                {"class_pattern": "com.example.MainActivity", "line": 25},
+                {"class_pattern": "com.example.MainActivity", "line": 25},
+                {"status": "set", "breakpoint_id": 1},
+                {},
+                id="set-breakpoint",
+            ),
+            pytest.param(
+                "set_breakpoint",
+                {
+                    "class_pattern": "com.example.MainActivity",
+                    "line": 30,
+                    "condition": "counter > 5",
+                },
+                {
+                    "class_pattern": "com.example.MainActivity",
+                    "line": 30,
+                    "condition": "counter > 5",
+                },
+                {"status": "set", "breakpoint_id": 2, "condition": "counter > 5"},
+                {},
+                id="set-breakpoint-condition",
+            ),
+            pytest.param(
+                "set_breakpoint",
+                {
+                    "class_pattern": "com.example.MainActivity",
+                    "line": 35,
+                    "log_message": "hit {hitCount} times, val={myVar}",
+                },
+                {
+                    "class_pattern": "com.example.MainActivity",
+                    "line": 35,
+                    "log_message": "hit {hitCount} times, val={myVar}",
+                },
+                {
+                    "status": "set",
+                    "breakpoint_id": 3,
+                    "log_message": "hit {hitCount} times, val={myVar}",
+                },
+                {},
+                id="set-breakpoint-log-message",
+            ),
+            pytest.param(
+                "set_breakpoint",
+                {
+                    "class_pattern": "com.example.MainActivity",
+                    "line": 40,
+                    "condition": "x > 0",
+                    "log_message": "x={x}",
+                },
+                {
+                    "class_pattern": "com.example.MainActivity",
+                    "line": 40,
+                    "condition": "x > 0",
+                    "log_message": "x={x}",
+                },
+                {"status": "set", "breakpoint_id": 4, "condition": "x > 0", "log_message": "x={x}"},
+                {},
+                id="set-breakpoint-condition-and-log-message",
+            ),
+            pytest.param(
+                "set_breakpoint",
+                {
+                    "class_pattern": "com.example.MainActivity",
+                    "line": 41,
+                    "log_message": "x={x}",
+                    "capture_stack": True,
+                    "stack_max_frames": 12,
+                },
+                {
+                    "class_pattern": "com.example.MainActivity",
+                    "line": 41,
+                    "log_message": "x={x}",
+                    "capture_stack": True,
+                    "stack_max_frames": 12,
+                },
+                {
+                    "status": "set",
+                    "breakpoint_id": 5,
+                    "log_message": "x={x}",
+                    "capture_stack": True,
+                    "stack_max_frames": 12,
+                },
+                {},
+                id="set-breakpoint-logpoint-stack-capture",
+            ),
+            pytest.param(
+                "list_threads",
+                {"include_daemon": True, "max_threads": 100},
+                {"include_daemon": True, "max_threads": 100},
+                {"threads": [], "total_threads": 0, "truncated": False},
+                {"status": "attached"},
+                id="list-threads",
+            ),
+            pytest.param(
+                "stack_trace",
+                {"thread_name": "main", "max_frames": 10},
+                {"thread_name": "main", "max_frames": 10},
+                {"thread": "main", "frames": []},
+                {},
+                id="stack-trace",
+            ),
+            pytest.param(
+                "inspect_variable",
+                {
+                    "variable_path": "user.profile",
+                    "thread_name": "main",
+                    "frame_index": 0,
+                    "depth": 2,
+                },
+                {
+                    "thread_name": "main",
+                    "frame_index": 0,
+                    "variable_path": "user.profile",
+                    "depth": 2,
+                },
+                {"variable_path": "user", "value": {"class": "User"}},
+                {},
+                id="inspect-variable",
+            ),
+            pytest.param(
+                "evaluate",
+                {"expression": "user.id", "thread_name": "main", "frame_index": 0},
+                {"thread_name": "main", "frame_index": 0, "expression": "user.id"},
+                {"expression": "user.id", "result": 42},
+                {},
+                id="evaluate",
+            ),
+            pytest.param(
+                "load_mapping",
+                {"path": "/tmp/mapping.txt"},
+                {"path": "/tmp/mapping.txt"},
+                {"status": "loaded", "path": "/tmp/mapping.txt"},
+                {},
+                id="load-mapping",
+            ),
+            pytest.param("clear_mapping", {}, None, {"status": "cleared"}, {}, id="clear-mapping"),
+            pytest.param(
+                "step_over",
+                {"thread_name": "main", "timeout_seconds": 10.0},
+                {"thread_name": "main", "timeout_seconds": 10.0},
+                _STEP_STOPPED,
+                {},
+                id="step-over",
+            ),
+            pytest.param(
+                "step_into",
+                {"thread_name": "main", "timeout_seconds": 10.0},
+                {"thread_name": "main", "timeout_seconds": 10.0},
+                _STEP_STOPPED,
+                {},
+                id="step-into",
+            ),
+            pytest.param(
+                "step_out",
+                {"thread_name": "main", "timeout_seconds": 10.0},
+                {"thread_name": "main", "timeout_seconds": 10.0},
+                _STEP_STOPPED,
+                {},
+                id="step-out",
+            ),
+            pytest.param(
+                "resume",
+                {"thread_name": None},
+                {},
+                {"status": "resumed", "scope": "all"},
+                {},
+                id="resume-all-threads",
+            ),
+            pytest.param(
+                "resume",
+                {"thread_name": "main"},
+                {"thread_name": "main"},
+                {"status": "resumed", "scope": "thread"},
+                {},
+                id="resume-specific-thread",
+            ),
+        ],
+    )
+    async def test_method_forwards_rpc(
+        self,
+        manager: DebugManager,
+        api: str,
+        kwargs: dict[str, Any],
+        expected_params: dict[str, Any] | None,
+        response: dict[str, Any],
+        envelope: dict[str, Any],
+    ) -> None:
+        """Each manager API issues one same-named bridge RPC and returns its result."""
+        bridge = _install_bridge(manager, response)
+
+        result = await getattr(manager, api)("s-test", **kwargs)
+        assert result == {**envelope, **response}
+        assert bridge.calls == [(api, expected_params)]
+
+    async def test_drain_events_returns_and_clears_queue(self, manager: DebugManager) -> None:
+        events = [
             {"type": "breakpoint_resolved", "breakpoint_id": 1},
             {"type": "breakpoint_hit", "breakpoint_id": 1},
         ]
+        manager._event_queues["s-test"] = list(events)
 
-        first = await manager.drain_events("s-test")
-        assert first["status"] == "attached"
-        assert first["count"] == 2
-        assert len(first["events"]) == 2
+        result = await manager.drain_events("s-test")
+        assert result["status"] == "attached"
+        assert result["count"] == 2
+        assert result["events"] == events
 
-        second = await manager.drain_events("s-test")
-        assert second["count"] == 0
-        assert second["events"] == []
+        assert manager._event_queues["s-test"] == []
 
-    @pytest.mark.asyncio
-    async def test_peek_events_limits_without_draining(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
+    async def test_peek_events_limits_without_draining(self, manager: DebugManager) -> None:
         manager._event_queues["s-test"] = [
             {"type": "breakpoint_resolved", "breakpoint_id": 1},
             {"type": "breakpoint_hit", "breakpoint_id": 1},
@@ -949,30 +904,12 @@ class TestMilestone2DebugMethods:
         ]
         assert len(manager._event_queues["s-test"]) == 3
 
-    @pytest.mark.asyncio
-    async def test_monitor_events_queues_breakpoint_notifications(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
+    async def test_monitor_events_queues_breakpoint_notifications(
+        self, manager: DebugManager
+    ) -> None:
+        bridge = EventSource(_BREAKPOINT_HIT_EVENT)
 
-        bridge = MagicMock()
-        bridge.next_event = AsyncMock(
-            side_effect=[
-                {
-                    "jsonrpc": "2.0",
-                    "method": "event",
-                    "params": {
-                        "type": "breakpoint_hit",
-                        "breakpoint_id": 3,
-                        "thread": "main",
-                        "location": "com.example.MainActivity:25",
-                    },
-                },
-                asyncio.CancelledError(),
-            ]
-        )
-
-        adb = MagicMock()
-        await manager._monitor_events("s-test", bridge, adb)
+        await manager._monitor_events("s-test", cast("BridgeClient", bridge), None)
 
         queued = manager._event_queues.get("s-test", [])
         assert len(queued) == 1
@@ -980,32 +917,10 @@ class TestMilestone2DebugMethods:
         assert queued[0]["breakpoint_id"] == 3
         assert isinstance(queued[0]["timestamp_ms"], int)
 
-    @pytest.mark.asyncio
-    async def test_monitor_events_records_logpoint_history(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
+    async def test_monitor_events_records_logpoint_history(self, manager: DebugManager) -> None:
+        bridge = EventSource(_LOGPOINT_HIT_EVENT)
 
-        bridge = MagicMock()
-        bridge.next_event = AsyncMock(
-            side_effect=[
-                {
-                    "jsonrpc": "2.0",
-                    "method": "event",
-                    "params": {
-                        "type": "logpoint_hit",
-                        "breakpoint_id": 9,
-                        "message": "x=3",
-                        "hit_count": 1,
-                        "thread": "main",
-                        "location": "com.example.MainActivity:55",
-                    },
-                },
-                asyncio.CancelledError(),
-            ]
-        )
-
-        adb = MagicMock()
-        await manager._monitor_events("s-test", bridge, adb)
+        await manager._monitor_events("s-test", cast("BridgeClient", bridge), None)
 
         queued = manager._event_queues.get("s-test", [])
         assert len(queued) == 1
@@ -1017,10 +932,7 @@ class TestMilestone2DebugMethods:
         assert history[0]["type"] == "logpoint_hit"
         assert history[0]["breakpoint_id"] == 9
 
-    @pytest.mark.asyncio
-    async def test_list_logpoint_hits_filters_by_breakpoint(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
+    async def test_list_logpoint_hits_filters_by_breakpoint(self, manager: DebugManager) -> None:
         manager._logpoint_histories["s-test"] = [
             {"type": "logpoint_hit", "breakpoint_id": 1, "timestamp_ms": 1000, "message": "a"},
             {"type": "logpoint_hit", "breakpoint_id": 2, "timestamp_ms": 2000, "message": "b"},
@@ -1042,71 +954,74 @@ class TestMilestone2DebugMethods:
 class TestBridgeErrorMapping:
     """Tests for JSON-RPC error mapping in debug manager."""
 
-    def test_object_collected_error_is_mapped(self) -> None:
-        with pytest.raises(AgentError) as exc_info:
-            DebugManager._ensure_bridge_result(
-                {"error": {"code": -32010, "message": "ERR_OBJECT_COLLECTED: stale object id"}},
-                method="inspect_variable",
-            )
-        assert exc_info.value.code == "ERR_OBJECT_COLLECTED"
-
-    def test_not_suspended_error_is_mapped(self) -> None:
-        with pytest.raises(AgentError) as exc_info:
-            DebugManager._ensure_bridge_result(
-                {"error": {"code": -32011, "message": "ERR_NOT_SUSPENDED: thread not paused"}},
-                method="stack_trace",
-            )
-        assert exc_info.value.code == "ERR_NOT_SUSPENDED"
-
-    def test_eval_unsupported_error_is_mapped(self) -> None:
-        with pytest.raises(AgentError) as exc_info:
-            DebugManager._ensure_bridge_result(
-                {
-                    "error": {
-                        "code": -32012,
-                        "message": "ERR_EVAL_UNSUPPORTED: method call forbidden",
-                    }
-                },
-                method="evaluate",
-            )
-        assert exc_info.value.code == "ERR_EVAL_UNSUPPORTED"
-
-    def test_step_timeout_error_is_mapped(self) -> None:
-        with pytest.raises(AgentError) as exc_info:
-            DebugManager._ensure_bridge_result(
-                {
-                    "error": {
-                        "code": -32020,
-                        "message": "ERR_STEP_TIMEOUT: step did not complete within 8s",
-                    }
-                },
-                method="step_over",
-                error_context={"thread_name": "main", "timeout_seconds": 8.0},
-            )
-        assert exc_info.value.code == "ERR_STEP_TIMEOUT"
-
-    def test_class_not_found_error_is_mapped(self) -> None:
-        with pytest.raises(AgentError) as exc_info:
-            DebugManager._ensure_bridge_result(
-                {"error": {"code": -32030, "message": "ERR_CLASS_NOT_FOUND: class not found"}},
-                method="set_breakpoint",
-                error_context={"class_pattern": "com.example.Missing", "line": 42},
-            )
-        assert exc_info.value.code == "ERR_CLASS_NOT_FOUND"
-
-    def test_breakpoint_invalid_line_error_is_mapped(self) -> None:
+    @pytest.mark.parametrize(
+        ("code", "message", "method", "error_context", "expected"),
+        [
+            pytest.param(
+                -32010,
+                "ERR_OBJECT_COLLECTED: stale object id",
+                "inspect_variable",
+                None,
+                "ERR_OBJECT_COLLECTED",
+                id="object-collected",
+            ),
+            pytest.param(
+                -32011,
+                "ERR_NOT_SUSPENDED: thread not paused",
+                "stack_trace",
+                None,
+                "ERR_NOT_SUSPENDED",
+                id="not-suspended",
+            ),
+            pytest.param(
+                -32012,
+                "ERR_EVAL_UNSUPPORTED: method call forbidden",
+                "evaluate",
+                None,
+                "ERR_EVAL_UNSUPPORTED",
+                id="eval-unsupported",
+            ),
+            pytest.param(
+                -32020,
+                "ERR_STEP_TIMEOUT: step did not complete within 8s",
+                "step_over",
+                {"thread_name": "main", "timeout_seconds": 8.0},
+                "ERR_STEP_TIMEOUT",
+                id="step-timeout",
+            ),
+            pytest.param(
+                -32030,
+                "ERR_CLASS_NOT_FOUND: class not found",
+                "set_breakpoint",
+                {"class_pattern": "com.example.Missing", "line": 42},
+                "ERR_CLASS_NOT_FOUND",
+                id="class-not-found",
+            ),
+            pytest.param(
+                -32031,
+                "ERR_BREAKPOINT_INVALID_LINE: no executable code",
+                "set_breakpoint",
+                {"class_pattern": "com.example.MainActivity", "line": 42},
+                "ERR_BREAKPOINT_INVALID_LINE",
+                id="breakpoint-invalid-line",
+            ),
+        ],
+    )
+    def test_error_is_mapped(
+        self,
+        code: int,
+        message: str,
+        method: str,
+        error_context: dict[str, Any] | None,
+        expected: str,
+    ) -> None:
         with pytest.raises(AgentError) as exc_info:
             DebugManager._ensure_bridge_result(
-                {
-                    "error": {
-                        "code": -32031,
-                        "message": "ERR_BREAKPOINT_INVALID_LINE: no executable code",
-                    }
-                },
-                method="set_breakpoint",
-                error_context={"class_pattern": "com.example.MainActivity", "line": 42},
+                {"error": {"code": code, "message": message}},
+                method=method,
+                error_context=error_context,
             )
-        assert exc_info.value.code == "ERR_BREAKPOINT_INVALID_LINE"
+        assert exc_info.value.code == expected
 
     def test_invalid_condition_error_is_mapped(self) -> None:
         with pytest.raises(AgentError) as exc_info:
@@ -1128,109 +1043,56 @@ class TestBridgeErrorMapping:
         assert exc_info.value.context.get("condition") == "counter >"
 
 
+@pytest.mark.usefixtures("attached_session")
 class TestExceptionBreakpoints:
     """Tests for exception breakpoint DebugManager proxy methods."""
 
-    @staticmethod
-    def _attach_session(manager: DebugManager, session_id: str = "s-test") -> None:
-        manager._debug_sessions[session_id] = DebugSessionState(
-            session_id=session_id,
-            package="com.example.app",
-            process_name="com.example.app",
-            pid=123,
-            jdwp_port=123,
-            local_forward_port=54321,
-            device_serial="emulator-5554",
-            state="attached",
-        )
-
-    @pytest.mark.asyncio
-    async def test_set_exception_breakpoint_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={
-                "status": "set",
-                "breakpoint_id": 1,
-                "class_pattern": "java.lang.NullPointerException",
-                "caught": True,
-                "uncaught": False,
-            }
-        )
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.set_exception_breakpoint(
-            "s-test",
-            "java.lang.NullPointerException",
-            caught=True,
-            uncaught=False,
-        )
-        assert result["status"] == "set"
-        assert result["breakpoint_id"] == 1
-        bridge.request.assert_awaited_once_with(
-            "set_exception_breakpoint",
-            {
-                "class_pattern": "java.lang.NullPointerException",
-                "caught": True,
-                "uncaught": False,
-            },
-        )
-
-    @pytest.mark.asyncio
-    async def test_set_exception_breakpoint_wildcard_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
-
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={
-                "status": "set",
-                "breakpoint_id": 2,
-                "class_pattern": "*",
-                "caught": True,
-                "uncaught": True,
-            }
-        )
-        manager._bridges["s-test"] = bridge
-
-        result = await manager.set_exception_breakpoint("s-test")
+    @pytest.mark.parametrize(
+        ("args", "kwargs", "expected_params"),
+        [
+            pytest.param(
+                ("java.lang.NullPointerException",),
+                {"caught": True, "uncaught": False},
+                {
+                    "class_pattern": "java.lang.NullPointerException",
+                    "caught": True,
+                    "uncaught": False,
+                },
+                id="explicit",
+            ),
+            pytest.param(
+                (),
+                {},
+                {"class_pattern": "*", "caught": True, "uncaught": True},
+                id="wildcard-default",
+            ),
+        ],
+    )
+    async def test_set_exception_breakpoint_forwards_rpc(
+        self,
+        manager: DebugManager,
+        args: tuple[str, ...],
+        kwargs: dict[str, Any],
+        expected_params: dict[str, Any],
+    ) -> None:
+        bridge = _install_bridge(manager, {"status": "set", "breakpoint_id": 1, **expected_params})
+
+        result = await manager.set_exception_breakpoint("s-test", *args, **kwargs)
         assert result["status"] == "set"
-        assert result["class_pattern"] == "*"
-        bridge.request.assert_awaited_once_with(
-            "set_exception_breakpoint",
-            {"class_pattern": "*", "caught": True, "uncaught": True},
-        )
-
-    @pytest.mark.asyncio
-    async def test_remove_exception_breakpoint_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
+        assert result["class_pattern"] == expected_params["class_pattern"]
+        assert bridge.calls == [("set_exception_breakpoint", expected_params)]
 
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(return_value={"status": "removed", "breakpoint_id": 1})
-        manager._bridges["s-test"] = bridge
+    async def test_remove_exception_breakpoint_forwards_rpc(self, manager: DebugManager) -> None:
+        bridge = _install_bridge(manager, {"status": "removed", "breakpoint_id": 1})
 
         result = await manager.remove_exception_breakpoint("s-test", 1)
         assert result["status"] == "removed"
-        bridge.request.assert_awaited_once_with(
-            "remove_exception_breakpoint",
-            {"breakpoint_id": 1},
-        )
-
-    @pytest.mark.asyncio
-    async def test_list_exception_breakpoints_forwards_rpc(self) -> None:
-        manager = DebugManager()
-        self._attach_session(manager)
+        assert bridge.calls == [("remove_exception_breakpoint", {"breakpoint_id": 1})]
 
-        bridge = AsyncMock()
-        bridge.is_alive = True
-        bridge.request = AsyncMock(
-            return_value={
+    async def test_list_exception_breakpoints_forwards_rpc(self, manager: DebugManager) -> None:
+        bridge = _install_bridge(
+            manager,
+            {
                 "count": 1,
                 "exception_breakpoints": [
                     {
@@ -1241,11 +1103,10 @@ class TestExceptionBreakpoints:
                         "status": "set",
                     },
                 ],
-            }
+            },
         )
-        manager._bridges["s-test"] = bridge
 
         result = await manager.list_exception_breakpoints("s-test")
         assert result["status"] == "attached"
         assert result["count"] == 1
-        bridge.request.assert_awaited_once_with("list_exception_breakpoints")
+        assert bridge.calls == [("list_exception_breakpoints", None)]
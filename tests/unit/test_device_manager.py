@@ -2,170 +2,196 @@
 
 from __future__ import annotations
 
+import asyncio
 import subprocess
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
+from android_emu_agent.device.manager import DeviceInfo, DeviceManager, Orientation
+from android_emu_agent.errors import AgentError
 
-class TestSetRotation:
-    """Tests for set_rotation."""
+_EMULATOR_INFO = DeviceInfo(
+    serial="emulator-5554",
+    model="sdk_phone",
+    sdk_version=30,
+    is_rooted=False,
+    is_emulator=True,
+)
 
-    @pytest.mark.asyncio
-    async def test_set_portrait(self) -> None:
-        """Should set rotation to portrait."""
-        from android_emu_agent.device.manager import DeviceManager, Orientation
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
+class FakeDevice:
+    """adb device stand-in that records shell commands and replays canned output.
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_rotation("emulator-5554", Orientation.PORTRAIT)
+    Each ``shell`` call returns the next output in order; the last one repeats.
+    """
 
-        # Should disable auto-rotate and set rotation
-        calls = [str(c) for c in mock_device.shell.call_args_list]
-        assert any("accelerometer_rotation" in c and "0" in c for c in calls)
-        assert any("user_rotation" in c and "0" in c for c in calls)
+    __slots__ = ("_outputs", "shell_calls")
 
-    @pytest.mark.asyncio
-    async def test_set_landscape(self) -> None:
-        """Should set rotation to landscape."""
-        from android_emu_agent.device.manager import DeviceManager, Orientation
+    def __init__(self, *outputs: str) -> None:
+        self._outputs = outputs or ("",)
+        self.shell_calls: list[str] = []
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
+    def shell(self, command: str) -> str:
+        self.shell_calls.append(command)
+        return self._outputs[min(len(self.shell_calls), len(self._outputs)) - 1]
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_rotation("emulator-5554", Orientation.LANDSCAPE)
 
-        calls = [str(c) for c in mock_device.shell.call_args_list]
-        assert any("user_rotation" in c and "1" in c for c in calls)
+class FakeConsoleReader:
+    """Emulator console reader that returns canned chunks, then EOF."""
 
-    @pytest.mark.asyncio
-    async def test_set_auto(self) -> None:
-        """Should enable auto-rotate."""
-        from android_emu_agent.device.manager import DeviceManager, Orientation
+    __slots__ = ("_chunks",)
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
+    def __init__(self, *chunks: bytes) -> None:
+        self._chunks = list(chunks)
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_rotation("emulator-5554", Orientation.AUTO)
+    async def read(self, _n: int = -1) -> bytes:
+        return self._chunks.pop(0) if self._chunks else b""
 
-        calls = [str(c) for c in mock_device.shell.call_args_list]
-        assert any("accelerometer_rotation" in c and "1" in c for c in calls)
 
+class FakeConsoleWriter:
+    """Emulator console writer that records written bytes."""
 
-class TestSetWifi:
-    """Tests for set_wifi."""
+    __slots__ = ("closed", "writes")
 
-    @pytest.mark.asyncio
-    async def test_enable_wifi(self) -> None:
-        """Should enable WiFi."""
-        from android_emu_agent.device.manager import DeviceManager
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+        self.closed = False
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
+    def write(self, data: bytes) -> None:
+        self.writes.append(data)
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_wifi("emulator-5554", enabled=True)
+    async def drain(self) -> None:
+        return None
 
-        mock_device.shell.assert_called_once()
-        call_arg = mock_device.shell.call_args[0][0]
-        assert "svc wifi enable" in call_arg
+    def close(self) -> None:
+        self.closed = True
 
-    @pytest.mark.asyncio
-    async def test_disable_wifi(self) -> None:
-        """Should disable WiFi."""
-        from android_emu_agent.device.manager import DeviceManager
+    async def wait_closed(self) -> None:
+        return None
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_wifi("emulator-5554", enabled=False)
+def _connect(manager: DeviceManager, device: FakeDevice) -> None:
+    """Make ``manager`` hand out ``device`` for every serial."""
 
-        call_arg = mock_device.shell.call_args[0][0]
-        assert "svc wifi disable" in call_arg
+    async def get_adb_device(serial: str) -> Any:  # noqa: ARG001
+        return device
 
+    manager.get_adb_device = get_adb_device
 
-class TestSetMobile:
-    """Tests for set_mobile."""
 
-    @pytest.mark.asyncio
-    async def test_enable_mobile(self) -> None:
-        """Should enable mobile data."""
-        from android_emu_agent.device.manager import DeviceManager
+@pytest.fixture
+def manager() -> DeviceManager:
+    """Fresh DeviceManager; tests replace its adb hooks as needed."""
+    return DeviceManager()
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_mobile("emulator-5554", enabled=True)
+@pytest.fixture(scope="session")
+def fake_apk(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Path to an empty APK file; app_install only checks that it exists."""
+    apk = tmp_path_factory.mktemp("apks") / "app-debug.apk"
+    apk.write_bytes(b"")
+    return str(apk)
 
-        call_arg = mock_device.shell.call_args[0][0]
-        assert "svc data enable" in call_arg
 
-    @pytest.mark.asyncio
-    async def test_disable_mobile(self) -> None:
-        """Should disable mobile data."""
-        from android_emu_agent.device.manager import DeviceManager
+class TestSetRotation:
+    """Tests for set_rotation."""
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
+    @pytest.mark.parametrize(
+        ("orientation", "expected"),
+        [
+            pytest.param(
+                Orientation.PORTRAIT,
+                [
+                    "settings put system accelerometer_rotation 0",
+                    "settings put system user_rotation 0",
+                ],
+                id="portrait",
+            ),
+            pytest.param(
+                Orientation.LANDSCAPE,
+                [
+                    "settings put system accelerometer_rotation 0",
+                    "settings put system user_rotation 1",
+                ],
+                id="landscape",
+            ),
+            pytest.param(
+                Orientation.AUTO, ["settings put system accelerometer_rotation 1"], id="auto"
+            ),
+        ],
+    )
+    async def test_set_rotation(
+        self, manager: DeviceManager, orientation: Orientation, expected: list[str]
+    ) -> None:
+        """Should write the rotation settings for the requested orientation."""
+        device = FakeDevice()
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_mobile("emulator-5554", enabled=False)
+        _connect(manager, device)
+        await manager.set_rotation("emulator-5554", orientation)
 
-        call_arg = mock_device.shell.call_args[0][0]
-        assert "svc data disable" in call_arg
+        assert device.shell_calls == expected
 
 
-class TestSetDoze:
-    """Tests for set_doze."""
+class TestSetWifi:
+    """Tests for set_wifi."""
 
-    @pytest.mark.asyncio
-    async def test_enable_doze(self) -> None:
-        """Should force device into doze."""
-        from android_emu_agent.device.manager import DeviceManager
+    @pytest.mark.parametrize(
+        ("enabled", "expected"),
+        [(True, "svc wifi enable"), (False, "svc wifi disable")],
+    )
+    async def test_set_wifi(self, manager: DeviceManager, enabled: bool, expected: str) -> None:
+        """Should toggle WiFi."""
+        device = FakeDevice()
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
+        _connect(manager, device)
+        await manager.set_wifi("emulator-5554", enabled=enabled)
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_doze("emulator-5554", enabled=True)
+        assert device.shell_calls == [expected]
 
-        call_arg = mock_device.shell.call_args[0][0]
-        assert "deviceidle force-idle" in call_arg
 
-    @pytest.mark.asyncio
-    async def test_disable_doze(self) -> None:
-        """Should exit doze mode."""
-        from android_emu_agent.device.manager import DeviceManager
+class TestSetMobile:
+    """Tests for set_mobile."""
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
+    @pytest.mark.parametrize(
+        ("enabled", "expected"),
+        [(True, "svc data enable"), (False, "svc data disable")],
+    )
+    async def test_set_mobile(self, manager: DeviceManager, enabled: bool, expected: str) -> None:
+        """Should toggle mobile data."""
+        device = FakeDevice()
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.set_doze("emulator-5554", enabled=False)
+        _connect(manager, device)
+        await manager.set_mobile("emulator-5554", enabled=enabled)
 
-        call_arg = mock_device.shell.call_args[0][0]
-        assert "deviceidle unforce" in call_arg
+        assert device.shell_calls == [expected]
+
+
+class TestSetDoze:
+    """Tests for set_doze."""
+
+    @pytest.mark.parametrize(
+        ("enabled", "expected"),
+        [(True, "dumpsys deviceidle force-idle"), (False, "dumpsys deviceidle unforce")],
+    )
+    async def test_set_doze(self, manager: DeviceManager, enabled: bool, expected: str) -> None:
+        """Should force device into or out of doze."""
+        device = FakeDevice()
+
+        _connect(manager, device)
+        await manager.set_doze("emulator-5554", enabled=enabled)
+
+        assert device.shell_calls == [expected]
 
 
 class TestAppInstall:
     """Tests for app_install."""
 
-    @pytest.mark.asyncio
-    async def test_install_default_flags(self, tmp_path) -> None:
+    async def test_install_default_flags(self, manager: DeviceManager, fake_apk: str) -> None:
         """Should install APK with replace enabled by default."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        apk = tmp_path / "app-debug.apk"
-        apk.write_text("fake-apk", encoding="utf-8")
+        device = FakeDevice()
         run_adb = AsyncMock(
             return_value=subprocess.CompletedProcess(
                 args=[],
@@ -175,24 +201,16 @@ class TestAppInstall:
             )
         )
 
-        with (
-            patch.object(manager, "get_adb_device", return_value=mock_device),
-            patch.object(manager, "_run_adb", run_adb),
-        ):
-            output = await manager.app_install("emulator-5554", str(apk))
+        _connect(manager, device)
+        manager._run_adb = run_adb
+        output = await manager.app_install("emulator-5554", fake_apk)
 
         assert output == "Success"
-        run_adb.assert_awaited_once_with("emulator-5554", ["install", "-r", str(apk)])
+        run_adb.assert_awaited_once_with("emulator-5554", ["install", "-r", fake_apk])
 
-    @pytest.mark.asyncio
-    async def test_install_optional_flags(self, tmp_path) -> None:
+    async def test_install_optional_flags(self, manager: DeviceManager, fake_apk: str) -> None:
         """Should include optional install flags when requested."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        apk = tmp_path / "app-release.apk"
-        apk.write_text("fake-apk", encoding="utf-8")
+        device = FakeDevice()
         run_adb = AsyncMock(
             return_value=subprocess.CompletedProcess(
                 args=[],
@@ -202,34 +220,28 @@ class TestAppInstall:
             )
         )
 
-        with (
-            patch.object(manager, "get_adb_device", return_value=mock_device),
-            patch.object(manager, "_run_adb", run_adb),
-        ):
-            await manager.app_install(
-                "emulator-5554",
-                str(apk),
-                replace=False,
-                grant_permissions=True,
-                allow_downgrade=True,
-            )
+        _connect(manager, device)
+        manager._run_adb = run_adb
+        await manager.app_install(
+            "emulator-5554",
+            fake_apk,
+            replace=False,
+            grant_permissions=True,
+            allow_downgrade=True,
+        )
 
         run_adb.assert_awaited_once_with(
             "emulator-5554",
-            ["install", "-g", "-d", str(apk)],
+            ["install", "-g", "-d", fake_apk],
         )
 
 
 class TestAppUninstall:
     """Tests for app_uninstall."""
 
-    @pytest.mark.asyncio
-    async def test_uninstall_default_flags(self) -> None:
+    async def test_uninstall_default_flags(self, manager: DeviceManager) -> None:
         """Should uninstall package without keeping data by default."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
+        device = FakeDevice()
         run_adb = AsyncMock(
             return_value=subprocess.CompletedProcess(
                 args=[],
@@ -239,22 +251,16 @@ class TestAppUninstall:
             )
         )
 
-        with (
-            patch.object(manager, "get_adb_device", return_value=mock_device),
-            patch.object(manager, "_run_adb", run_adb),
-        ):
-            output = await manager.app_uninstall("emulator-5554", "com.example.app")
+        _connect(manager, device)
+        manager._run_adb = run_adb
+        output = await manager.app_uninstall("emulator-5554", "com.example.app")
 
         assert output == "Success"
         run_adb.assert_awaited_once_with("emulator-5554", ["uninstall", "com.example.app"])
 
-    @pytest.mark.asyncio
-    async def test_uninstall_keep_data_flag(self) -> None:
+    async def test_uninstall_keep_data_flag(self, manager: DeviceManager) -> None:
         """Should include keep-data flag when requested."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
+        device = FakeDevice()
         run_adb = AsyncMock(
             return_value=subprocess.CompletedProcess(
                 args=[],
@@ -264,11 +270,9 @@ class TestAppUninstall:
             )
         )
 
-        with (
-            patch.object(manager, "get_adb_device", return_value=mock_device),
-            patch.object(manager, "_run_adb", run_adb),
-        ):
-            await manager.app_uninstall("emulator-5554", "com.example.app", keep_data=True)
+        _connect(manager, device)
+        manager._run_adb = run_adb
+        await manager.app_uninstall("emulator-5554", "com.example.app", keep_data=True)
 
         run_adb.assert_awaited_once_with(
             "emulator-5554",
@@ -279,96 +283,75 @@ class TestAppUninstall:
 class TestAppLaunch:
     """Tests for app_launch."""
 
-    @pytest.mark.asyncio
-    async def test_launch_with_activity(self) -> None:
+    async def test_launch_with_activity(self, manager: DeviceManager) -> None:
         """Should launch app with explicit activity."""
-        from android_emu_agent.device.manager import DeviceManager
+        device = FakeDevice("Starting: Intent { ... }")
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "Starting: Intent { ... }"
-
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            result = await manager.app_launch(
-                "emulator-5554", "com.example.app", activity=".MainActivity"
-            )
+        _connect(manager, device)
+        result = await manager.app_launch(
+            "emulator-5554", "com.example.app", activity=".MainActivity"
+        )
 
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert "am start" in call_arg
         assert "com.example.app/.MainActivity" in call_arg
         assert result == ".MainActivity"
 
-    @pytest.mark.asyncio
-    async def test_launch_quotes_component(self) -> None:
+    async def test_launch_quotes_component(self, manager: DeviceManager) -> None:
         """Should quote the activity component before passing it to adb shell."""
-        from android_emu_agent.device.manager import DeviceManager
+        device = FakeDevice("Starting: Intent { ... }")
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "Starting: Intent { ... }"
+        _connect(manager, device)
+        await manager.app_launch("emulator-5554", "com.example.app", activity="MainActivity;id")
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.app_launch(
-                "emulator-5554", "com.example.app", activity="MainActivity;id"
-            )
-
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert "'com.example.app/.MainActivity;id'" in call_arg
 
-    @pytest.mark.asyncio
-    async def test_launch_wait_for_debugger(self) -> None:
+    async def test_launch_wait_for_debugger(self, manager: DeviceManager) -> None:
         """Should add -D when debugger wait is requested."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "Starting: Intent { ... }"
-
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.app_launch(
-                "emulator-5554",
-                "com.example.app",
-                activity=".MainActivity",
-                wait_for_debugger=True,
-            )
+        device = FakeDevice("Starting: Intent { ... }")
 
-        call_arg = mock_device.shell.call_args[0][0]
+        _connect(manager, device)
+        await manager.app_launch(
+            "emulator-5554",
+            "com.example.app",
+            activity=".MainActivity",
+            wait_for_debugger=True,
+        )
+
+        call_arg = device.shell_calls[-1]
         assert "am start -D -n" in call_arg
 
-    @pytest.mark.asyncio
-    async def test_launch_resolve_activity(self) -> None:
+    async def test_launch_resolve_activity(self, manager: DeviceManager) -> None:
         """Should resolve launcher activity when not specified."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
         # First call: resolve activity, second call: launch
-        mock_device.shell.side_effect = [
+        device = FakeDevice(
             "priority=0 preferredOrder=0\ncom.example.app/.LauncherActivity",
             "Starting: Intent { ... }",
-        ]
+        )
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            result = await manager.app_launch("emulator-5554", "com.example.app")
+        _connect(manager, device)
+        result = await manager.app_launch("emulator-5554", "com.example.app")
 
         assert result == ".LauncherActivity"
+        assert device.shell_calls == [
+            "cmd package resolve-activity --brief -c android.intent.category.LAUNCHER "
+            "com.example.app",
+            "am start -n com.example.app/.LauncherActivity",
+        ]
 
 
 class TestAppForceStop:
     """Tests for app_force_stop."""
 
-    @pytest.mark.asyncio
-    async def test_force_stop(self) -> None:
+    async def test_force_stop(self, manager: DeviceManager) -> None:
         """Should force stop app."""
-        from android_emu_agent.device.manager import DeviceManager
+        device = FakeDevice()
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
+        _connect(manager, device)
+        await manager.app_force_stop("emulator-5554", "com.example.app")
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.app_force_stop("emulator-5554", "com.example.app")
-
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert "am force-stop" in call_arg
         assert "com.example.app" in call_arg
 
@@ -376,97 +359,73 @@ class TestAppForceStop:
 class TestAppReset:
     """Tests for app_reset."""
 
-    @pytest.mark.asyncio
-    async def test_reset_quotes_package(self) -> None:
+    async def test_reset_quotes_package(self, manager: DeviceManager) -> None:
         """Should quote package names before passing them to adb shell."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
+        device = FakeDevice()
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.app_reset("emulator-5554", "com.example.app;id")
+        _connect(manager, device)
+        await manager.app_reset("emulator-5554", "com.example.app;id")
 
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert call_arg == "pm clear 'com.example.app;id'"
 
 
 class TestAppDeeplink:
     """Tests for app_deeplink."""
 
-    @pytest.mark.asyncio
-    async def test_deeplink_custom_scheme(self) -> None:
+    async def test_deeplink_custom_scheme(self, manager: DeviceManager) -> None:
         """Should open custom scheme deeplink."""
-        from android_emu_agent.device.manager import DeviceManager
+        device = FakeDevice("Starting: Intent { act=android.intent.action.VIEW ... }")
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "Starting: Intent { act=android.intent.action.VIEW ... }"
+        _connect(manager, device)
+        await manager.app_deeplink("emulator-5554", "myapp://deep/link")
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.app_deeplink("emulator-5554", "myapp://deep/link")
-
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert "am start" in call_arg
         assert "android.intent.action.VIEW" in call_arg
         assert "myapp://deep/link" in call_arg
 
-    @pytest.mark.asyncio
-    async def test_deeplink_https(self) -> None:
+    async def test_deeplink_https(self, manager: DeviceManager) -> None:
         """Should open https deeplink."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "Starting: Intent { ... }"
+        device = FakeDevice("Starting: Intent { ... }")
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.app_deeplink("emulator-5554", "https://example.com/path")
+        _connect(manager, device)
+        await manager.app_deeplink("emulator-5554", "https://example.com/path")
 
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert "https://example.com/path" in call_arg
 
-    @pytest.mark.asyncio
-    async def test_deeplink_wait_for_debugger(self) -> None:
+    async def test_deeplink_wait_for_debugger(self, manager: DeviceManager) -> None:
         """Should include debugger wait flag for deeplink launch."""
-        from android_emu_agent.device.manager import DeviceManager
+        device = FakeDevice("Starting: Intent { ... }")
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "Starting: Intent { ... }"
-
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.app_deeplink(
-                "emulator-5554",
-                "https://example.com/path",
-                wait_for_debugger=True,
-            )
+        _connect(manager, device)
+        await manager.app_deeplink(
+            "emulator-5554",
+            "https://example.com/path",
+            wait_for_debugger=True,
+        )
 
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert "am start -D" in call_arg
 
 
 class TestAppIntent:
     """Tests for app_start_intent."""
 
-    @pytest.mark.asyncio
-    async def test_start_intent_with_component_and_action(self) -> None:
+    async def test_start_intent_with_component_and_action(self, manager: DeviceManager) -> None:
         """Should start explicit intent command."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "Starting: Intent { ... }"
-
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.app_start_intent(
-                "emulator-5554",
-                action="android.intent.action.MAIN",
-                component="com.example.app/.MainActivity",
-                package="com.example.app",
-            )
+        device = FakeDevice("Starting: Intent { ... }")
+
+        _connect(manager, device)
+        await manager.app_start_intent(
+            "emulator-5554",
+            action="android.intent.action.MAIN",
+            component="com.example.app/.MainActivity",
+            package="com.example.app",
+        )
 
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert "android.intent.action.MAIN" in call_arg
         assert "com.example.app/.MainActivity" in call_arg
         assert call_arg.endswith("com.example.app")
@@ -475,62 +434,30 @@ class TestAppIntent:
 class TestListPackages:
     """Tests for list_packages."""
 
-    @pytest.mark.asyncio
-    async def test_list_packages_all(self) -> None:
-        """Should list all packages."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "package:com.example\npackage:com.sample\n"
-
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            packages = await manager.list_packages("emulator-5554", scope="all")
+    @pytest.mark.parametrize(
+        ("scope", "expected"),
+        [
+            ("all", "pm list packages"),
+            ("system", "pm list packages -s"),
+            ("third-party", "pm list packages -3"),
+        ],
+    )
+    async def test_list_packages(self, manager: DeviceManager, scope: str, expected: str) -> None:
+        """Should list packages using the pm flag for the requested scope."""
+        device = FakeDevice("package:com.example\npackage:com.sample\n")
+
+        _connect(manager, device)
+        packages = await manager.list_packages("emulator-5554", scope=scope)
 
         assert packages == ["com.example", "com.sample"]
-        call_arg = mock_device.shell.call_args[0][0]
-        assert call_arg == "pm list packages"
-
-    @pytest.mark.asyncio
-    async def test_list_packages_system(self) -> None:
-        """Should list system packages."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = ""
-
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.list_packages("emulator-5554", scope="system")
-
-        call_arg = mock_device.shell.call_args[0][0]
-        assert call_arg == "pm list packages -s"
-
-    @pytest.mark.asyncio
-    async def test_list_packages_third_party(self) -> None:
-        """Should list third-party packages."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = ""
-
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            await manager.list_packages("emulator-5554", scope="third-party")
-
-        call_arg = mock_device.shell.call_args[0][0]
-        assert call_arg == "pm list packages -3"
+        assert device.shell_calls == [expected]
 
 
 class TestEmulatorSnapshot:
     """Tests for emulator snapshot methods."""
 
-    @pytest.mark.asyncio
-    async def test_list_avds(self) -> None:
+    async def test_list_avds(self, manager: DeviceManager) -> None:
         """Should list AVD names from emulator CLI output."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
         completed = subprocess.CompletedProcess(
             args=[],
             returncode=0,
@@ -558,12 +485,8 @@ class TestEmulatorSnapshot:
             tool="emulator",
         )
 
-    @pytest.mark.asyncio
-    async def test_emulator_start(self) -> None:
+    async def test_emulator_start(self, manager: DeviceManager) -> None:
         """Should build emulator CLI args and wait for boot by default."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
         process = MagicMock()
         process.pid = 4321
 
@@ -633,12 +556,8 @@ class TestEmulatorSnapshot:
             "wait_boot": True,
         }
 
-    @pytest.mark.asyncio
-    async def test_emulator_stop(self) -> None:
+    async def test_emulator_stop(self, manager: DeviceManager) -> None:
         """Should stop a running emulator through adb emu kill."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
 
         with (
             patch.object(manager, "evict_device", AsyncMock()) as mock_evict,
@@ -655,37 +574,31 @@ class TestEmulatorSnapshot:
         mock_run_adb.assert_awaited_once_with("emulator-5554", ["emu", "kill"])
         mock_wait_disconnect.assert_awaited_once_with("emulator-5554")
 
-    @pytest.mark.asyncio
-    async def test_snapshot_save(self) -> None:
+    async def test_snapshot_save(
+        self, manager: DeviceManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Should save emulator snapshot."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-
-        with patch("asyncio.open_connection") as mock_conn:
-            mock_reader = AsyncMock()
-            mock_writer = MagicMock()
-            mock_writer.drain = AsyncMock()
-            mock_writer.wait_closed = AsyncMock()
-            # Simulate console responses
-            mock_reader.read.side_effect = [
-                b"Android Console: type 'help' for a list of commands\r\nOK\r\n",
-                b"OK\r\n",
-            ]
-            mock_conn.return_value = (mock_reader, mock_writer)
-
-            await manager.emulator_snapshot_save("emulator-5554", "baseline")
-
-            # Verify command was sent
-            write_calls = [str(c) for c in mock_writer.write.call_args_list]
-            assert any("avd snapshot save baseline" in c for c in write_calls)
-
-    @pytest.mark.asyncio
-    async def test_snapshot_restore(self) -> None:
-        """Should restore emulator snapshot via stop/load/start by default."""
-        from android_emu_agent.device.manager import DeviceManager
+        # Simulate console responses
+        reader = FakeConsoleReader(
+            b"Android Console: type 'help' for a list of commands\r\nOK\r\n",
+            b"OK\r\n",
+        )
+        writer = FakeConsoleWriter()
+
+        async def open_connection(
+            _host: str, _port: int
+        ) -> tuple[FakeConsoleReader, FakeConsoleWriter]:
+            return reader, writer
+
+        monkeypatch.setattr(asyncio, "open_connection", open_connection)
+
+        await manager.emulator_snapshot_save("emulator-5554", "baseline")
 
-        manager = DeviceManager()
+        assert writer.writes == [b"avd snapshot save baseline\n"]
+        assert writer.closed
+
+    async def test_snapshot_restore(self, manager: DeviceManager) -> None:
+        """Should restore emulator snapshot via stop/load/start by default."""
 
         with (
             patch.object(manager, "evict_device", AsyncMock()) as mock_evict,
@@ -702,12 +615,8 @@ class TestEmulatorSnapshot:
         ]
         mock_wait.assert_awaited_once_with("emulator-5554")
 
-    @pytest.mark.asyncio
-    async def test_snapshot_restore_without_restart(self) -> None:
+    async def test_snapshot_restore_without_restart(self, manager: DeviceManager) -> None:
         """Should support live snapshot load without restarting."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
 
         with (
             patch.object(manager, "evict_device", AsyncMock()) as mock_evict,
@@ -722,12 +631,8 @@ class TestEmulatorSnapshot:
         mock_wait.assert_not_awaited()
         mock_refresh.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_wait_for_emulator_ready(self) -> None:
+    async def test_wait_for_emulator_ready(self, manager: DeviceManager) -> None:
         """Should wait for ADB and boot completion after restart."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
         completed = [
             subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr=""),
             subprocess.CompletedProcess(args=[], returncode=0, stdout="0\n", stderr=""),
@@ -749,13 +654,8 @@ class TestEmulatorSnapshot:
         mock_refresh.assert_awaited_once()
         mock_sleep.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_snapshot_not_emulator(self) -> None:
+    async def test_snapshot_not_emulator(self, manager: DeviceManager) -> None:
         """Should reject non-emulator serial."""
-        from android_emu_agent.device.manager import DeviceManager
-        from android_emu_agent.errors import AgentError
-
-        manager = DeviceManager()
 
         with pytest.raises(AgentError) as exc_info:
             await manager.emulator_snapshot_save("device-123", "baseline")
@@ -766,12 +666,8 @@ class TestEmulatorSnapshot:
 class TestEvictDevice:
     """Tests for evict_device."""
 
-    @pytest.mark.asyncio
-    async def test_evict_clears_connections(self) -> None:
+    async def test_evict_clears_connections(self, manager: DeviceManager) -> None:
         """Should clear cached adb and u2 connections."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
         # Simulate cached connections
         manager._adb_devices["emulator-5554"] = MagicMock()
         manager._u2_devices["emulator-5554"] = MagicMock()
@@ -781,33 +677,18 @@ class TestEvictDevice:
         assert "emulator-5554" not in manager._adb_devices
         assert "emulator-5554" not in manager._u2_devices
 
-    @pytest.mark.asyncio
-    async def test_evict_preserves_device_info(self) -> None:
+    async def test_evict_preserves_device_info(self, manager: DeviceManager) -> None:
         """Should preserve device info dict."""
-        from android_emu_agent.device.manager import DeviceInfo, DeviceManager
-
-        manager = DeviceManager()
-        info = DeviceInfo(
-            serial="emulator-5554",
-            model="sdk_phone",
-            sdk_version=30,
-            is_rooted=False,
-            is_emulator=True,
-        )
-        manager._devices["emulator-5554"] = info
+        manager._devices["emulator-5554"] = _EMULATOR_INFO
         manager._adb_devices["emulator-5554"] = MagicMock()
 
         await manager.evict_device("emulator-5554")
 
         assert "emulator-5554" in manager._devices
-        assert manager._devices["emulator-5554"] == info
+        assert manager._devices["emulator-5554"] is _EMULATOR_INFO
 
-    @pytest.mark.asyncio
-    async def test_evict_nonexistent_device(self) -> None:
+    async def test_evict_nonexistent_device(self, manager: DeviceManager) -> None:
         """Should handle evicting device with no cached connections."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
         # Should not raise
         await manager.evict_device("nonexistent-device")
 
@@ -815,88 +696,74 @@ class TestEvictDevice:
 class TestAppCurrent:
     """Tests for app_current."""
 
-    @pytest.mark.asyncio
-    async def test_app_current_parses_component(self) -> None:
+    async def test_app_current_parses_component(self, manager: DeviceManager) -> None:
         """Should parse foreground package/activity from dumpsys line."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.side_effect = [
+        device = FakeDevice(
             "mResumedActivity: ActivityRecord{123 u0 com.example.app/.MainActivity t77}",
             "",
-        ]
+        )
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            result = await manager.app_current("emulator-5554")
+        _connect(manager, device)
+        result = await manager.app_current("emulator-5554")
 
         assert result["package"] == "com.example.app"
         assert result["activity"] == ".MainActivity"
         assert result["component"] == "com.example.app/.MainActivity"
+        assert device.shell_calls == [
+            "dumpsys activity activities | grep -m 1 mResumedActivity",
+            "dumpsys activity activities | grep -m 1 mFocusedApp",
+        ]
 
 
 class TestAppTaskStack:
     """Tests for app_task_stack."""
 
-    @pytest.mark.asyncio
-    async def test_app_task_stack_runs_dumpsys_activity_activities(self) -> None:
+    async def test_app_task_stack_runs_dumpsys_activity_activities(
+        self, manager: DeviceManager
+    ) -> None:
         """Should query task stack using dumpsys activity activities."""
-        from android_emu_agent.device.manager import DeviceManager
+        device = FakeDevice("TASK 77: com.example.app/.MainActivity")
 
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "TASK 77: com.example.app/.MainActivity"
-
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            output = await manager.app_task_stack("emulator-5554")
+        _connect(manager, device)
+        output = await manager.app_task_stack("emulator-5554")
 
         assert "TASK 77" in output
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert call_arg == "dumpsys activity activities"
 
 
 class TestAppResolveIntent:
     """Tests for app_resolve_intent."""
 
-    @pytest.mark.asyncio
-    async def test_app_resolve_intent_parses_component(self) -> None:
+    async def test_app_resolve_intent_parses_component(self, manager: DeviceManager) -> None:
         """Should parse resolved component from resolve-activity output."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = (
+        device = FakeDevice(
             "priority=0 preferredOrder=0 match=0x108000 specificIndex=-1 isDefault=true\n"
             "com.example.app/.DeepLinkActivity"
         )
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            result = await manager.app_resolve_intent(
-                "emulator-5554",
-                action="android.intent.action.VIEW",
-                data_uri="https://example.com/item",
-                package="com.example.app",
-            )
+        _connect(manager, device)
+        result = await manager.app_resolve_intent(
+            "emulator-5554",
+            action="android.intent.action.VIEW",
+            data_uri="https://example.com/item",
+            package="com.example.app",
+        )
 
         assert result.component == "com.example.app/.DeepLinkActivity"
-        call_arg = mock_device.shell.call_args[0][0]
+        call_arg = device.shell_calls[-1]
         assert "cmd package resolve-activity --brief" in call_arg
         assert "android.intent.action.VIEW" in call_arg
         assert "https://example.com/item" in call_arg
 
-    @pytest.mark.asyncio
-    async def test_app_resolve_intent_handles_not_found(self) -> None:
+    async def test_app_resolve_intent_handles_not_found(self, manager: DeviceManager) -> None:
         """Should keep resolved component empty when nothing matches."""
-        from android_emu_agent.device.manager import DeviceManager
-
-        manager = DeviceManager()
-        mock_device = MagicMock()
-        mock_device.shell.return_value = "No activity found"
+        device = FakeDevice("No activity found")
 
-        with patch.object(manager, "get_adb_device", return_value=mock_device):
-            result = await manager.app_resolve_intent(
-                "emulator-5554",
-                action="android.intent.action.VIEW",
-            )
+        _connect(manager, device)
+        result = await manager.app_resolve_intent(
+            "emulator-5554",
+            action="android.intent.action.VIEW",
+        )
 
         assert result.component is None
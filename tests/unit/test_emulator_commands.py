@@ -2,178 +2,132 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import patch
 
+import pytest
 
-class DummyResponse:
-    """Simple response stub for CLI handlers."""
+from android_emu_agent.cli.commands import emulator
 
-    def __init__(self, payload: dict[str, Any]) -> None:
-        self._payload = payload
+Call = tuple[str, str, dict[str, Any] | None, float]
 
-    def json(self) -> dict[str, Any]:
-        return self._payload
 
-
-def test_emulator_snapshot_save_builds_payload() -> None:
-    """Should send snapshot save payload to the daemon."""
-    from android_emu_agent.cli.commands import emulator
-
-    calls: list[tuple[str, str, dict[str, Any] | None]] = []
-
-    class DummyClient:
-        def __init__(self, *_: Any, **__: Any) -> None:
-            pass
-
-        def request(self, method: str, path: str, json_body: dict[str, Any] | None = None):
-            calls.append((method, path, json_body))
-            return DummyResponse({"status": "done"})
-
-        def close(self) -> None:
-            return None
-
-    with patch.object(emulator, "DaemonClient", DummyClient):
-        emulator.emulator_snapshot_save(
-            "emulator-5554",
-            "baseline",
-            json_output=False,
-        )
-
-    method, path, payload = calls[0]
-    assert method == "POST"
-    assert path == "/emulator/snapshot_save"
-    assert payload == {"serial": "emulator-5554", "name": "baseline"}
-
-
-def test_emulator_list_avds_requests_daemon() -> None:
-    """Should request AVDs from the daemon."""
-    from android_emu_agent.cli.commands import emulator
-
-    calls: list[tuple[str, str, dict[str, Any] | None]] = []
-
-    class DummyClient:
-        def __init__(self, *_: Any, **__: Any) -> None:
-            pass
-
-        def request(self, method: str, path: str, json_body: dict[str, Any] | None = None):
-            calls.append((method, path, json_body))
-            return DummyResponse({"status": "done", "avds": ["Pixel_8_API_34"]})
-
-        def close(self) -> None:
-            return None
-
-    with patch.object(emulator, "DaemonClient", DummyClient):
-        emulator.emulator_list_avds(json_output=False)
-
-    method, path, payload = calls[0]
-    assert method == "GET"
-    assert path == "/emulator/avds"
-    assert payload is None
+@pytest.fixture
+def response() -> dict[str, Any]:
+    """Payload the patched DaemonClient answers with; tests add fields as needed."""
+    return {"status": "done"}
 
 
-def test_emulator_start_builds_payload_with_options() -> None:
-    """Should send emulator start options to the daemon."""
-    from android_emu_agent.cli.commands import emulator
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch, response: dict[str, Any]) -> list[Call]:
+    """Patch the emulator CLI's DaemonClient and return the requests it records.
 
-    calls: list[tuple[str, str, dict[str, Any] | None, float]] = []
+    Each request is captured as ``(method, path, json_body, timeout)``.
+    """
+    recorded: list[Call] = []
 
     class DummyClient:
         def __init__(self, *_: Any, timeout: float = 10.0, **__: Any) -> None:
             self.timeout = timeout
 
-        def request(self, method: str, path: str, json_body: dict[str, Any] | None = None):
-            calls.append((method, path, json_body, self.timeout))
-            return DummyResponse({"status": "done", "serial": "emulator-5554"})
+        def request(
+            self, method: str, path: str, json_body: dict[str, Any] | None = None
+        ) -> SimpleNamespace:
+            recorded.append((method, path, json_body, self.timeout))
+            return SimpleNamespace(json=lambda: response)
 
         def close(self) -> None:
             return None
 
-    with patch.object(emulator, "DaemonClient", DummyClient):
-        emulator.emulator_start(
-            "Pixel_8_API_34",
-            snapshot="clean",
-            wipe_data=False,
-            cold_boot=False,
-            no_snapshot_save=True,
-            read_only=True,
-            no_window=True,
-            port=5554,
-            wait_boot=True,
-            json_output=False,
-        )
-
-    method, path, payload, timeout = calls[0]
-    assert method == "POST"
-    assert path == "/emulator/start"
-    assert timeout == 240.0
-    assert payload == {
-        "avd_name": "Pixel_8_API_34",
-        "snapshot": "clean",
-        "wipe_data": False,
-        "cold_boot": False,
-        "no_snapshot_save": True,
-        "read_only": True,
-        "no_window": True,
-        "port": 5554,
-        "wait_boot": True,
-    }
-
-
-def test_emulator_stop_builds_payload() -> None:
-    """Should send emulator stop payload with extended timeout."""
-    from android_emu_agent.cli.commands import emulator
-
-    calls: list[tuple[str, str, dict[str, Any] | None, float]] = []
+    monkeypatch.setattr(emulator, "DaemonClient", DummyClient)
+    return recorded
 
-    class DummyClient:
-        def __init__(self, *_: Any, timeout: float = 10.0, **__: Any) -> None:
-            self.timeout = timeout
 
-        def request(self, method: str, path: str, json_body: dict[str, Any] | None = None):
-            calls.append((method, path, json_body, self.timeout))
-            return DummyResponse({"status": "done"})
+def test_emulator_snapshot_save_builds_payload(calls: list[Call]) -> None:
+    """Should send snapshot save payload to the daemon."""
+    emulator.emulator_snapshot_save(
+        "emulator-5554",
+        "baseline",
+        json_output=False,
+    )
+
+    assert calls == [
+        (
+            "POST",
+            "/emulator/snapshot_save",
+            {"serial": "emulator-5554", "name": "baseline"},
+            10.0,
+        )
+    ]
 
-        def close(self) -> None:
-            return None
 
-    with patch.object(emulator, "DaemonClient", DummyClient):
-        emulator.emulator_stop("emulator-5554", json_output=False)
+def test_emulator_list_avds_requests_daemon(calls: list[Call], response: dict[str, Any]) -> None:
+    """Should request AVDs from the daemon."""
+    response["avds"] = ["Pixel_8_API_34"]
+    emulator.emulator_list_avds(json_output=False)
 
-    method, path, payload, timeout = calls[0]
-    assert method == "POST"
-    assert path == "/emulator/stop"
-    assert timeout == 60.0
-    assert payload == {"serial": "emulator-5554"}
+    assert calls == [("GET", "/emulator/avds", None, 10.0)]
 
 
-def test_emulator_snapshot_restore_builds_restart_payload() -> None:
-    """Should request a restart-backed snapshot restore by default."""
-    from android_emu_agent.cli.commands import emulator
+def test_emulator_start_builds_payload_with_options(
+    calls: list[Call], response: dict[str, Any]
+) -> None:
+    """Should send emulator start options to the daemon."""
+    response["serial"] = "emulator-5554"
+    emulator.emulator_start(
+        "Pixel_8_API_34",
+        snapshot="clean",
+        wipe_data=False,
+        cold_boot=False,
+        no_snapshot_save=True,
+        read_only=True,
+        no_window=True,
+        port=5554,
+        wait_boot=True,
+        json_output=False,
+    )
+
+    assert calls == [
+        (
+            "POST",
+            "/emulator/start",
+            {
+                "avd_name": "Pixel_8_API_34",
+                "snapshot": "clean",
+                "wipe_data": False,
+                "cold_boot": False,
+                "no_snapshot_save": True,
+                "read_only": True,
+                "no_window": True,
+                "port": 5554,
+                "wait_boot": True,
+            },
+            240.0,
+        )
+    ]
 
-    calls: list[tuple[str, str, dict[str, Any] | None, float]] = []
 
-    class DummyClient:
-        def __init__(self, *_: Any, timeout: float = 10.0, **__: Any) -> None:
-            self.timeout = timeout
+def test_emulator_stop_builds_payload(calls: list[Call]) -> None:
+    """Should send emulator stop payload with extended timeout."""
+    emulator.emulator_stop("emulator-5554", json_output=False)
 
-        def request(self, method: str, path: str, json_body: dict[str, Any] | None = None):
-            calls.append((method, path, json_body, self.timeout))
-            return DummyResponse({"status": "done"})
+    assert calls == [("POST", "/emulator/stop", {"serial": "emulator-5554"}, 60.0)]
 
-        def close(self) -> None:
-            return None
 
-    with patch.object(emulator, "DaemonClient", DummyClient):
-        emulator.emulator_snapshot_restore(
-            "emulator-5554",
-            "baseline",
-            restart=True,
-            json_output=False,
+def test_emulator_snapshot_restore_builds_restart_payload(calls: list[Call]) -> None:
+    """Should request a restart-backed snapshot restore by default."""
+    emulator.emulator_snapshot_restore(
+        "emulator-5554",
+        "baseline",
+        restart=True,
+        json_output=False,
+    )
+
+    assert calls == [
+        (
+            "POST",
+            "/emulator/snapshot_restore",
+            {"serial": "emulator-5554", "name": "baseline", "restart": True},
+            180.0,
         )
-
-    method, path, payload, timeout = calls[0]
-    assert method == "POST"
-    assert path == "/emulator/snapshot_restore"
-    assert timeout == 180.0
-    assert payload == {"serial": "emulator-5554", "name": "baseline", "restart": True}
+    ]
@@ -5,8 +5,16 @@ from __future__ import annotations
 from android_emu_agent.errors import (
     AgentError,
     blocked_input_error,
+    console_connect_error,
     device_offline_error,
+    invalid_package_error,
+    invalid_selector_error,
+    invalid_uri_error,
+    launch_failed_error,
+    not_emulator_error,
     not_found_error,
+    package_not_found_error,
+    snapshot_failed_error,
     stale_ref_error,
     timeout_error,
 )
@@ -84,8 +92,6 @@ class TestErrorConstructors:
 
     def test_not_emulator_error(self) -> None:
         """Should create not-emulator error."""
-        from android_emu_agent.errors import not_emulator_error
-
         error = not_emulator_error("device-123")
         assert error.code == "ERR_NOT_EMULATOR"
         assert "device-123" in error.message
@@ -93,56 +99,42 @@ class TestErrorConstructors:
 
     def test_console_connect_error(self) -> None:
         """Should create console connect error."""
-        from android_emu_agent.errors import console_connect_error
-
         error = console_connect_error(5554)
         assert error.code == "ERR_CONSOLE_CONNECT"
         assert "5554" in error.message
 
     def test_snapshot_failed_error(self) -> None:
         """Should create snapshot failed error."""
-        from android_emu_agent.errors import snapshot_failed_error
-
         error = snapshot_failed_error("baseline", "not found")
         assert error.code == "ERR_SNAPSHOT_FAILED"
         assert "baseline" in error.message
 
     def test_invalid_package_error(self) -> None:
         """Should create invalid package error."""
-        from android_emu_agent.errors import invalid_package_error
-
         error = invalid_package_error("bad package!")
         assert error.code == "ERR_INVALID_PACKAGE"
         assert "bad package!" in error.message
 
     def test_package_not_found_error(self) -> None:
         """Should create package not found error."""
-        from android_emu_agent.errors import package_not_found_error
-
         error = package_not_found_error("com.missing.app")
         assert error.code == "ERR_PACKAGE_NOT_FOUND"
         assert "com.missing.app" in error.message
 
     def test_launch_failed_error(self) -> None:
         """Should create launch failed error."""
-        from android_emu_agent.errors import launch_failed_error
-
         error = launch_failed_error("com.test.app", "Activity not found")
         assert error.code == "ERR_LAUNCH_FAILED"
         assert "com.test.app" in error.message
 
     def test_invalid_uri_error(self) -> None:
         """Should create invalid URI error."""
-        from android_emu_agent.errors import invalid_uri_error
-
         error = invalid_uri_error("not-a-uri")
         assert error.code == "ERR_INVALID_URI"
         assert "not-a-uri" in error.message
 
     def test_invalid_selector_error(self) -> None:
         """Should create invalid selector error."""
-        from android_emu_agent.errors import invalid_selector_error
-
         error = invalid_selector_error("bad:selector")
         assert error.code == "ERR_INVALID_SELECTOR"
         assert "bad:selector" in error.message
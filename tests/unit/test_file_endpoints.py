@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -87,24 +88,30 @@ class DummyCore:
         return self._running
 
 
-@contextmanager
-def _client_with_core(
-    *,
-    info: DummyInfo,
-    matches: list[dict[str, Any]],
-) -> Any:
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """Run one daemon app (and DummyCore) for the whole module."""
     from android_emu_agent.daemon import server
 
-    file_manager = DummyFileManager(matches)
-    DummyCore.device_manager = DummyDeviceManager(device=object(), info=info)
+    DummyCore.device_manager = DummyDeviceManager(device=object(), info=None)
     DummyCore.session_manager = DummySessionManager()
-    DummyCore.file_manager = file_manager
+    DummyCore.file_manager = DummyFileManager([])
 
     with patch.object(server, "DaemonCore", DummyCore), TestClient(server.app) as client:
-        yield client, file_manager
+        yield client
+
+
+def _install_managers(*, info: DummyInfo, matches: list[dict[str, Any]]) -> DummyFileManager:
+    """Swap fresh device/file managers into the running DummyCore."""
+    core = DummyCore.last
+    assert core is not None
+    file_manager = DummyFileManager(matches)
+    core.device_manager = DummyDeviceManager(device=object(), info=info)
+    core.file_manager = file_manager
+    return file_manager
 
 
-def test_files_find_success() -> None:
+def test_files_find_success(client: TestClient) -> None:
     """Should return matches and format output."""
     matches = [
         {
@@ -119,20 +126,17 @@ def test_files_find_success() -> None:
             "mtime_epoch": 1700000000,
         }
     ]
-    with _client_with_core(info=DummyInfo(is_rooted=True), matches=matches) as (
-        client,
-        file_manager,
-    ):
-        resp = client.post(
-            "/files/find",
-            json={
-                "serial": "emulator-5554",
-                "path": "/data/data",
-                "name": "*.db",
-                "kind": "file",
-                "max_depth": 2,
-            },
-        )
+    file_manager = _install_managers(info=DummyInfo(is_rooted=True), matches=matches)
+    resp = client.post(
+        "/files/find",
+        json={
+            "serial": "emulator-5554",
+            "path": "/data/data",
+            "name": "*.db",
+            "kind": "file",
+            "max_depth": 2,
+        },
+    )
 
     assert resp.status_code == 200
     data = resp.json()
@@ -146,7 +150,7 @@ def test_files_find_success() -> None:
     assert (path, name, kind, depth) == ("/data/data", "*.db", "file", 2)
 
 
-def test_files_list_success() -> None:
+def test_files_list_success(client: TestClient) -> None:
     """Should list directory entries with metadata."""
     matches = [
         {
@@ -161,18 +165,15 @@ def test_files_list_success() -> None:
             "mtime_epoch": 1700000100,
         }
     ]
-    with _client_with_core(info=DummyInfo(is_rooted=True), matches=matches) as (
-        client,
-        file_manager,
-    ):
-        resp = client.post(
-            "/files/list",
-            json={
-                "serial": "emulator-5554",
-                "path": "/sdcard",
-                "kind": "dir",
-            },
-        )
+    file_manager = _install_managers(info=DummyInfo(is_rooted=True), matches=matches)
+    resp = client.post(
+        "/files/list",
+        json={
+            "serial": "emulator-5554",
+            "path": "/sdcard",
+            "kind": "dir",
+        },
+    )
 
     assert resp.status_code == 200
     data = resp.json()
@@ -184,20 +185,17 @@ def test_files_list_success() -> None:
     assert (path, kind) == ("/sdcard", "dir")
 
 
-def test_files_find_requires_root() -> None:
+def test_files_find_requires_root(client: TestClient) -> None:
     """Should reject find when device is not rooted."""
-    with _client_with_core(info=DummyInfo(is_rooted=False), matches=[]) as (
-        client,
-        _file_manager,
-    ):
-        resp = client.post(
-            "/files/find",
-            json={
-                "serial": "emulator-5554",
-                "path": "/data/data",
-                "name": "*.db",
-            },
-        )
+    _install_managers(info=DummyInfo(is_rooted=False), matches=[])
+    resp = client.post(
+        "/files/find",
+        json={
+            "serial": "emulator-5554",
+            "path": "/data/data",
+            "name": "*.db",
+        },
+    )
 
     assert resp.status_code == 403
     data = resp.json()
@@ -205,19 +203,16 @@ def test_files_find_requires_root() -> None:
     assert data["error"]["code"] == "ERR_PERMISSION"
 
 
-def test_files_list_requires_root() -> None:
+def test_files_list_requires_root(client: TestClient) -> None:
     """Should reject list when device is not rooted."""
-    with _client_with_core(info=DummyInfo(is_rooted=False), matches=[]) as (
-        client,
-        _file_manager,
-    ):
-        resp = client.post(
-            "/files/list",
-            json={
-                "serial": "emulator-5554",
-                "path": "/sdcard",
-            },
-        )
+    _install_managers(info=DummyInfo(is_rooted=False), matches=[])
+    resp = client.post(
+        "/files/list",
+        json={
+            "serial": "emulator-5554",
+            "path": "/sdcard",
+        },
+    )
 
     assert resp.status_code == 403
     data = resp.json()